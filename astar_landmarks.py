@@ -0,0 +1,229 @@
+"""
+Цілеспрямований пошук найкоротшого шляху поверх dijkstra_heap.Graph.
+
+Реалізація:
+  - A* з довільною евристикою h(v) — нижньою оцінкою відстані v -> target
+    (наприклад, евклідова відстань за координатами вершин).
+  - ALT (A*, Landmarks, Triangle inequality): відстані від/до кількох
+    орієнтирів обчислюються один раз, зберігаються на диск як індекс і дають
+    нижню оцінку через нерівність трикутника.
+  - Кожен запит повертає кількість остаточно оброблених (settled) вершин,
+    щоб порівнювати з звичайним Дейкстрою.
+
+Евристика має бути допустимою й узгодженою (h(u) <= w(u, v) + h(v)),
+інакше знайдений шлях може бути не найкоротшим.
+
+Python 3.10+
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Iterable
+from array import array
+import heapq
+import math
+import pickle
+import random
+
+from dijkstra_heap import Graph
+
+Heuristic = Callable[[Any], float]
+
+
+@dataclass
+class SearchResult:
+    path: List[Any]
+    distance: float
+    settled: int
+
+
+def astar(graph: Graph, source: Any, target: Any,
+          heuristic: Optional[Heuristic] = None) -> SearchResult:
+    """A* від source до target; без евристики це Дейкстра з ранньою зупинкою."""
+    if source not in graph.adj:
+        raise KeyError(f"Початкова вершина {source!r} відсутня у графі.")
+    if target not in graph.adj:
+        raise KeyError(f"Цільова вершина {target!r} відсутня у графі.")
+    h = heuristic if heuristic is not None else (lambda v: 0.0)
+
+    dist: Dict[Any, float] = {source: 0.0}
+    prev: Dict[Any, Optional[Any]] = {source: None}
+    # Мін-купа: (dist + h, вершина)
+    heap: list[tuple[float, Any]] = [(h(source), source)]
+    closed: set[Any] = set()
+    inf = float('inf')
+
+    while heap:
+        _, u = heapq.heappop(heap)
+        if u in closed:
+            continue
+        closed.add(u)
+        if u == target:
+            break
+        du = dist[u]
+        for v, w in graph.adj[u]:
+            alt = du + w
+            if alt < dist.get(v, inf):
+                hv = h(v)
+                if hv == inf:
+                    continue
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(heap, (alt + hv, v))
+
+    if target not in closed:
+        return SearchResult([], inf, len(closed))
+    path = []
+    cur = target
+    while cur is not None:
+        path.append(cur)
+        cur = prev[cur]
+    path.reverse()
+    return SearchResult(path, dist[target], len(closed))
+
+
+def euclidean_heuristic(coords: Dict[Any, tuple[float, float]], target: Any,
+                        scale: float = 1.0) -> Heuristic:
+    """
+    h(v) = scale * |coords[v] - coords[target]|.
+    scale — мінімальне відношення ваги ребра до його геометричної довжини
+    (1.0, якщо вага не менша за відстань між кінцями).
+    """
+    tx, ty = coords[target]
+    return lambda v: scale * math.hypot(coords[v][0] - tx, coords[v][1] - ty)
+
+
+def _distances(graph: Graph, source: Any, index: Dict[Any, int]) -> array:
+    dist, _ = graph.dijkstra(source)
+    out = array("d", bytes(8 * len(index)))
+    for v, d in dist.items():
+        out[index[v]] = d
+    return out
+
+
+@dataclass
+class LandmarkIndex:
+    """
+    Відстані від кожного орієнтира L до всіх вершин (forward) і від усіх
+    вершин до L (backward; для неорієнтованого графа — ті самі масиви).
+    """
+    ids: List[Any]
+    landmarks: List[Any]
+    forward: List[array]
+    backward: List[array]
+    num_edges: int
+
+    @classmethod
+    def build(cls, graph: Graph, k: int = 4, seed: Optional[int] = None,
+              landmarks: Optional[Iterable[Any]] = None) -> "LandmarkIndex":
+        """
+        Якщо landmarks не задано, обираємо k орієнтирів жадібно "найдальшими":
+        кожен наступний — найвіддаленіша досяжна вершина від уже обраних.
+        """
+        ids = graph.vertices()
+        if not ids:
+            raise ValueError("Порожній граф.")
+        index = {v: i for i, v in enumerate(ids)}
+        reverse = Graph(directed=True, adj=graph.reverse_adj()) if graph.directed else None
+
+        chosen: List[Any] = []
+        forward: List[array] = []
+        backward: List[array] = []
+
+        def add(lm: Any) -> None:
+            chosen.append(lm)
+            fwd = _distances(graph, lm, index)
+            forward.append(fwd)
+            backward.append(_distances(reverse, lm, index) if reverse is not None else fwd)
+
+        if landmarks is not None:
+            for lm in landmarks:
+                add(lm)
+        else:
+            rng = random.Random(seed)
+            add(ids[rng.randrange(len(ids))])
+            nearest = list(forward[0])
+            while len(chosen) < min(k, len(ids)):
+                best_i, best_d = -1, -1.0
+                for i, d in enumerate(nearest):
+                    if d != float('inf') and d > best_d and ids[i] not in chosen:
+                        best_i, best_d = i, d
+                if best_i < 0:
+                    # Решта недосяжна від обраних — беремо будь-яку нову вершину
+                    rest = [v for v in ids if v not in chosen]
+                    best_i = index[rest[rng.randrange(len(rest))]]
+                add(ids[best_i])
+                nearest = [min(a, b) for a, b in zip(nearest, forward[-1])]
+
+        num_edges = sum(len(e) for e in graph.adj.values())
+        return cls(ids, chosen, forward, backward, num_edges)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            pickle.dump({"ids": self.ids, "landmarks": self.landmarks,
+                         "forward": self.forward, "backward": self.backward,
+                         "num_edges": self.num_edges}, f)
+
+    @classmethod
+    def load(cls, path: str, graph: Optional[Graph] = None) -> "LandmarkIndex":
+        """Завантажує індекс; з graph перевіряє, що він збудований саме для нього."""
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        idx = cls(data["ids"], data["landmarks"], data["forward"],
+                  data["backward"], data["num_edges"])
+        if graph is not None:
+            num_edges = sum(len(e) for e in graph.adj.values())
+            if idx.ids != graph.vertices() or idx.num_edges != num_edges:
+                raise ValueError("Індекс орієнтирів не відповідає графу.")
+        return idx
+
+    def heuristic(self, target: Any) -> Heuristic:
+        """
+        h(v) = max по L з max(d(L,t) - d(L,v), d(v,L) - d(t,L)).
+        Доданки з нескінченними відстанями пропускаємо — оцінка лишається допустимою.
+        """
+        index = {v: i for i, v in enumerate(self.ids)}
+        t = index[target]
+        inf = float('inf')
+        terms = [(fwd, fwd[t], bwd, bwd[t]) for fwd, bwd in zip(self.forward, self.backward)]
+
+        def h(v: Any) -> float:
+            i = index[v]
+            best = 0.0
+            for fwd, lt, bwd, tl in terms:
+                lv, vl = fwd[i], bwd[i]
+                if lt != inf and lv != inf and lt - lv > best:
+                    best = lt - lv
+                if vl != inf and tl != inf and vl - tl > best:
+                    best = vl - tl
+            return best
+
+        return h
+
+    def query(self, graph: Graph, source: Any, target: Any) -> SearchResult:
+        return astar(graph, source, target, self.heuristic(target))
+
+
+if __name__ == "__main__":
+    # Демонстрація на решітці 60x60 з вагами не меншими за евклідову довжину
+    rng = random.Random(7)
+    size = 60
+    g = Graph(directed=False)
+    coords = {}
+    for x in range(size):
+        for y in range(size):
+            coords[(x, y)] = (float(x), float(y))
+            if x + 1 < size:
+                g.add_edge((x, y), (x + 1, y), 1.0 + rng.random())
+            if y + 1 < size:
+                g.add_edge((x, y), (x, y + 1), 1.0 + rng.random())
+
+    src, dst = (2, 3), (size - 5, size - 2)
+    plain = astar(g, src, dst)
+    geo = astar(g, src, dst, euclidean_heuristic(coords, dst))
+    lm = LandmarkIndex.build(g, k=4, seed=1)
+    alt = lm.query(g, src, dst)
+    print(f"Дейкстра: відстань = {plain.distance:.3f}, оброблено вершин = {plain.settled}")
+    print(f"A* (евклід): відстань = {geo.distance:.3f}, оброблено вершин = {geo.settled}")
+    print(f"ALT ({len(lm.landmarks)} орієнтири): відстань = {alt.distance:.3f}, "
+          f"оброблено вершин = {alt.settled}")
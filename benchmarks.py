@@ -0,0 +1,219 @@
+"""
+Бенчмарки для алгоритмів репозиторію.
+
+Для кожного модуля є навантаження з фіксованим зерном (генератори — у
+workloads.py) у трьох масштабах (small / medium / large):
+  - Graph.dijkstra і Graph.shortest_path на випадкових розріджених графах;
+  - SinglyLinkedList: побудова, merge_sort, insertion_sort;
+  - dynamic_programming проти greedy_algorithm для кількох бюджетів;
+  - simulate_two_dice на 10^5–5·10^6 кидків.
+
+Для кожного бенчмарку записуються найкращий і медіанний час за кілька
+повторів та пікова пам'ять (tracemalloc, окремий прогін — трасування
+сповільнює код і на час не впливає). Результати зберігаються в JSON-базу;
+наступні запуски порівнюються з нею, регресії позначаються, а код виходу
+стає 1.
+
+    python benchmarks.py --save                  # записати базу
+    python benchmarks.py                         # порівняти з базою
+    python benchmarks.py --scale large -k dijkstra
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from dijkstra_heap import Graph
+from linked_list_tasks import SinglyLinkedList
+from meal_selection import dynamic_programming, greedy_algorithm
+from monte_carlo_dice import simulate_two_dice
+from workloads import SEED, random_menu, random_sparse_graph, random_values
+
+SCALES = ("small", "medium", "large")
+BASELINE_PATH = "benchmarks_baseline.json"
+# Допустиме погіршення відносно бази (0.25 — на 25% повільніше або більше пам'яті)
+TOLERANCE = 0.25
+# Абсолютні зміни, менші за ці, не вважаються регресією (шум таймера й алокатора)
+TIME_SLACK = 0.001
+MEMORY_SLACK = 64 * 1024
+
+
+@dataclass
+class Benchmark:
+    name: str
+    scale: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+
+
+# --- Набір бенчмарків ---
+
+def _dijkstra_benchmarks(scale: str, n: int) -> List[Benchmark]:
+    def setup() -> Graph:
+        return random_sparse_graph(n)
+
+    rng = random.Random(SEED + n)
+    source, target = rng.randrange(n), rng.randrange(n)
+    return [
+        Benchmark(f"dijkstra.full[n={n}]", scale, setup, lambda g: g.dijkstra(source)),
+        Benchmark(f"dijkstra.shortest_path[n={n}]", scale, setup,
+                  lambda g: g.shortest_path(source, target)),
+        Benchmark(f"dijkstra.shortest_path_bidir[n={n}]", scale, setup,
+                  lambda g: g.shortest_path(source, target, bidirectional=True)),
+    ]
+
+
+def _linked_list_benchmarks(scale: str, n: int, n_insertion: int) -> List[Benchmark]:
+    values = random_values(n)
+    small = random_values(n_insertion)
+    return [
+        Benchmark(f"linked_list.build[n={n}]", scale, lambda: values, SinglyLinkedList),
+        Benchmark(f"linked_list.merge_sort[n={n}]", scale,
+                  lambda: SinglyLinkedList(values), lambda lst: lst.merge_sort()),
+        Benchmark(f"linked_list.insertion_sort[n={n_insertion}]", scale,
+                  lambda: SinglyLinkedList(small), lambda lst: lst.insertion_sort()),
+    ]
+
+
+def _knapsack_benchmarks(scale: str, n_items: int, budgets: List[int]) -> List[Benchmark]:
+    items = random_menu(n_items)
+    out = []
+    for budget in budgets:
+        for label, solver in (("dp", dynamic_programming), ("greedy", greedy_algorithm)):
+            out.append(Benchmark(f"knapsack.{label}[items={n_items},budget={budget}]", scale,
+                                 lambda: items, lambda it, s=solver, b=budget: s(it, b)))
+    return out
+
+
+def _dice_benchmarks(scale: str, n_rolls: int) -> List[Benchmark]:
+    def run(seed: int) -> Any:
+        random.seed(seed)
+        return simulate_two_dice(n_rolls)
+
+    return [Benchmark(f"dice.simulate_two_dice[n={n_rolls}]", scale, lambda: SEED, run)]
+
+
+def build_suite(scales: List[str]) -> List[Benchmark]:
+    params = {
+        # graph n, (list n, insertion n), (items, budgets), rolls
+        "small": (1_000, (10_000, 500), (20, [100, 500]), 100_000),
+        "medium": (10_000, (100_000, 1_000), (100, [1_000, 5_000]), 1_000_000),
+        "large": (100_000, (1_000_000, 2_000), (300, [10_000, 30_000]), 5_000_000),
+    }
+    suite: List[Benchmark] = []
+    for scale in scales:
+        n_graph, (n_list, n_ins), (n_items, budgets), n_rolls = params[scale]
+        suite += _dijkstra_benchmarks(scale, n_graph)
+        suite += _linked_list_benchmarks(scale, n_list, n_ins)
+        suite += _knapsack_benchmarks(scale, n_items, budgets)
+        suite += _dice_benchmarks(scale, n_rolls)
+    return suite
+
+
+# --- Вимірювання і порівняння з базою ---
+
+def measure(bench: Benchmark, repeat: int = 5) -> Dict[str, float]:
+    """Час (best/median за repeat прогонів) і пікова пам'ять одного бенчмарку."""
+    times = []
+    for _ in range(repeat):
+        state = bench.setup()
+        start = time.perf_counter()
+        bench.run(state)
+        times.append(time.perf_counter() - start)
+    state = bench.setup()
+    tracemalloc.start()
+    try:
+        bench.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"best_s": min(times), "median_s": statistics.median(times), "peak_bytes": peak}
+
+
+def compare(current: Dict[str, float], base: Optional[Dict[str, float]],
+            tolerance: float = TOLERANCE) -> List[str]:
+    """Список регресій (порожній — усе гаразд або бази для бенчмарку немає)."""
+    if base is None:
+        return []
+    problems = []
+    if current["best_s"] > base["best_s"] * (1 + tolerance) + TIME_SLACK:
+        problems.append(f"час {current['best_s'] / base['best_s']:.2f}x")
+    if current["peak_bytes"] > base["peak_bytes"] * (1 + tolerance) + MEMORY_SLACK:
+        problems.append(f"пам'ять {current['peak_bytes'] / max(base['peak_bytes'], 1):.2f}x")
+    return problems
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["results"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки алгоритмів з JSON-базою")
+    parser.add_argument("--scale", choices=SCALES + ("all",), action="append",
+                        help="Масштаб навантаження (можна кілька разів; за замовчуванням small і medium)")
+    parser.add_argument("-k", "--filter", default="", help="Лише бенчмарки, назва яких містить рядок")
+    parser.add_argument("--repeat", type=int, default=5, help="К-ть повторів для вимірювання часу")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Шлях до JSON-бази")
+    parser.add_argument("--save", action="store_true", help="Записати результати як нову базу")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="Допустиме погіршення відносно бази (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    scales = args.scale or ["small", "medium"]
+    if "all" in scales:
+        scales = list(SCALES)
+    suite = [b for b in build_suite(scales) if args.filter in b.name]
+    baseline = {} if args.save else load_baseline(args.baseline)
+    if not args.save and not baseline:
+        print(f"База {args.baseline} не знайдена — лише вимірювання (додайте --save).")
+
+    results, regressions = {}, 0
+    print(f"{'бенчмарк':<48} {'best, мс':>10} {'median, мс':>11} {'пік, КБ':>10}  {'база':>8}")
+    for bench in suite:
+        res = measure(bench, args.repeat)
+        results[bench.name] = res
+        base = baseline.get(bench.name)
+        problems = compare(res, base, args.tolerance)
+        regressions += bool(problems)
+        ratio = f"{res['best_s'] / base['best_s']:.2f}x" if base else "—"
+        flag = "  РЕГРЕСІЯ: " + ", ".join(problems) if problems else ""
+        print(f"{bench.name:<48} {res['best_s'] * 1e3:>10.2f} {res['median_s'] * 1e3:>11.2f} "
+              f"{res['peak_bytes'] / 1024:>10.1f}  {ratio:>8}{flag}")
+
+    if args.save:
+        # Нова база доповнює стару: бенчмарки інших масштабів не губляться
+        merged = load_baseline(args.baseline)
+        merged.update(results)
+        save_baseline(args.baseline, merged)
+        print(f"Базу записано в {args.baseline} ({len(results)} бенчмарків).")
+    if regressions:
+        print(f"Регресій: {regressions}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Єдина точка входу для всіх завдань:
+
+    python cli.py dijkstra  --edges graph.csv --source A --target Z
+    python cli.py knapsack  --items menu.json --budget 100 --solver dp
+    python cli.py dice      -n 1000000 --seed 42 --json
+    python cli.py fractal   --depth 16 --save tree.png
+    python cli.py traversal --mode inorder --nodes 15 --json
+
+Модулі з алгоритмами імпортуються лише в обробнику обраної підкоманди,
+а matplotlib / networkx — лише коли результат справді малюється
+(--plot, --animate, --save, fractal без --json). Тому обчислювальні
+команди запускаються майже так само швидко, як сам інтерпретатор.
+--json виводить результат одним JSON-об'єктом для пакетних задач.
+"""
+
+import argparse
+import json
+import sys
+
+
+def _emit(args, result, lines):
+    """Друкує result як JSON (--json) або людиночитні рядки lines."""
+    if args.json:
+        json.dump(result, sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        print("\n".join(lines))
+
+
+def _vertex(graph, name):
+    # Вершини з --random і --int-ids — цілі числа, з файлу — рядки
+    return int(name) if graph.ids and isinstance(graph.ids[0], int) else name
+
+
+def _path_length(graph, path):
+    """Довжина шляху в CSRGraph: сума найлегших паралельних ребер уздовж нього."""
+    total = 0.0
+    for u, v in zip(path, path[1:]):
+        j = graph.index[v]
+        total += min(w for x, w in graph.neighbors(graph.index[u]) if x == j)
+    return total
+
+
+def cmd_dijkstra(args):
+    if args.random:
+        from workloads import SEED, random_sparse_graph
+        seed = SEED if args.seed is None else args.seed
+        graph = random_sparse_graph(args.random, seed=seed).compile()
+    elif args.edges:
+        from graph_io import load_edge_list
+        graph = load_edge_list(args.edges, directed=args.directed, delimiter=args.delimiter,
+                               has_header=args.header, vertex_type=int if args.int_ids else str)
+    else:
+        raise SystemExit("dijkstra: потрібен --edges ФАЙЛ або --random N")
+    source = _vertex(graph, args.source)
+    if args.target is None:
+        dist, _ = graph.dijkstra(source)
+        reachable = {str(v): d for v, d in dist.items() if d != float("inf")}
+        result = {"source": args.source, "reachable": len(reachable), "distances": reachable}
+        _emit(args, result, [f"{args.source} -> {v}: {d}" for v, d in reachable.items()])
+        return
+    target = _vertex(graph, args.target)
+    path = graph.shortest_path(source, target, bidirectional=args.bidirectional)
+    distance = _path_length(graph, path) if path else None
+    result = {"source": args.source, "target": args.target, "distance": distance,
+              "path": [str(v) for v in path]}
+    _emit(args, result, [f"Шлях: {' -> '.join(map(str, path))}" if path else "Шляху немає",
+                         f"Довжина: {distance}"])
+
+
+def cmd_knapsack(args):
+    import meal_selection as ms
+    if args.items:
+        with open(args.items, encoding="utf-8") as f:
+            items = json.load(f)
+    elif args.random:
+        from workloads import SEED, random_menu
+        items = random_menu(args.random, seed=SEED if args.seed is None else args.seed)
+    else:
+        raise SystemExit("knapsack: потрібен --items ФАЙЛ.json або --random N")
+    solvers = {
+        "auto": lambda: ms.solve_meals(items, args.budget, eps=args.eps),
+        "greedy": lambda: ms.greedy_algorithm(items, args.budget),
+        "dp": lambda: ms.dynamic_programming(items, args.budget),
+        "numpy": lambda: ms.dynamic_programming_numpy(items, args.budget),
+        "bb": lambda: ms.branch_and_bound(items, args.budget),
+        "fptas": lambda: ms.fptas(items, args.budget, eps=args.eps),
+    }
+    chosen, cost, calories = solvers[args.solver]()
+    result = {"solver": args.solver, "budget": args.budget, "items": chosen,
+              "cost": cost, "calories": calories}
+    _emit(args, result, [f"Страви: {', '.join(chosen)}", f"Вартість: {cost}", f"Калорії: {calories}"])
+
+
+def cmd_dice(args):
+    import monte_carlo_dice as mc
+    two_d6 = args.dice == 2 and args.faces == 6
+    if args.target_error is not None:
+        if not two_d6:
+            raise SystemExit("dice: --target-error підтримується лише для двох шестигранних кубиків")
+        est = mc.simulate_until(args.target_error, seed=args.seed)
+        n_rolls, counts, probs = est.n_rolls, est.counts, est.probs
+    elif args.engine == "numpy" or not two_d6:
+        if two_d6:
+            counts, probs = mc.simulate_two_dice_numpy(args.n_rolls, seed=args.seed, workers=args.workers)
+        else:
+            counts, probs = mc.simulate_dice(args.n_rolls, args.dice, args.faces, seed=args.seed)
+        n_rolls = args.n_rolls
+    else:
+        if args.seed is not None:
+            mc.random.seed(args.seed)
+        counts, probs = mc.simulate_two_dice(args.n_rolls)
+        n_rolls = args.n_rolls
+    ana = mc.analytical_probs(args.dice, args.faces)
+    result = {"n_rolls": n_rolls, "counts": {str(s): c for s, c in counts.items()},
+              "probs": {str(s): p for s, p in probs.items()},
+              "analytical": {str(s): p for s, p in ana.items()}}
+    _emit(args, result, [f"Кидків: {n_rolls}"] +
+          [f"Сума {s:>3}: сим = {probs[s]*100:6.2f}%, теор = {ana[s]*100:6.2f}%" for s in counts])
+    if args.plot:
+        if not two_d6:
+            raise SystemExit("dice: --plot підтримується лише для двох шестигранних кубиків")
+        mc.plot_probs(probs, ana)
+
+
+def cmd_fractal(args):
+    import pythagoras_tree as pt
+    if args.json:
+        # Лише геометрія, без matplotlib: кількість гілок на кожному рівні
+        _, _, levels = pt.tree_segments(args.depth, args.length)
+        from lazy_numpy import import_numpy
+        per_level = import_numpy().bincount(levels, minlength=args.depth).tolist() if levels.size else []
+        _emit(args, {"depth": args.depth, "segments": int(levels.size), "per_level": per_level}, [])
+        return
+    pt.render(args.depth, args.length, args.engine, args.lod, save=args.save)
+
+
+def cmd_traversal(args):
+    from tree_traversal import TRAVERSALS
+    import tree_traversal_visualization as tv
+    root = tv.build_complete_tree(args.nodes) if args.nodes else tv.build_sample_tree()
+    walk = TRAVERSALS[args.mode]
+    if args.animate or args.save:
+        tv.animate_traversal(root, walk, args.mode, pause=args.pause, save=args.save, fps=args.fps)
+        return
+    order = [node.val for node in walk(root)]
+    _emit(args, {"mode": args.mode, "order": order}, [" ".join(map(str, order))])
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Алгоритми: Дейкстра, рюкзак, Монте-Карло, фрактал, обходи дерева")
+    sub = parser.add_subparsers(dest="command", required=True)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", help="Вивести результат як JSON")
+    common.add_argument("--seed", type=int, default=None, help="Зерно генератора випадкових даних")
+
+    p = sub.add_parser("dijkstra", parents=[common], help="Найкоротші шляхи (Дейкстра)")
+    p.add_argument("--edges", help="Файл зі списком ребер u v w (CSV/TSV/пробіли)")
+    p.add_argument("--random", type=int, metavar="N", help="Випадковий розріджений граф з N вершин")
+    p.add_argument("--directed", action="store_true", help="Орієнтований граф (для --edges)")
+    p.add_argument("--delimiter", default=None, help="Роздільник у файлі ребер")
+    p.add_argument("--header", action="store_true", help="Перший рядок файлу — заголовок")
+    p.add_argument("--int-ids", action="store_true", help="Вершини у файлі — цілі числа")
+    p.add_argument("--source", required=True, help="Початкова вершина")
+    p.add_argument("--target", default=None, help="Кінцева вершина (без неї — відстані до всіх)")
+    p.add_argument("--bidirectional", action="store_true", help="Двонаправлений пошук")
+    p.set_defaults(func=cmd_dijkstra)
+
+    p = sub.add_parser("knapsack", parents=[common], help="Вибір страв (0/1-рюкзак)")
+    p.add_argument("--items", help='JSON {"назва": {"cost": ..., "calories": ...}}')
+    p.add_argument("--random", type=int, metavar="N", help="Випадкове меню з N страв")
+    p.add_argument("--budget", type=int, required=True, help="Бюджет")
+    p.add_argument("--solver", choices=["auto", "greedy", "dp", "numpy", "bb", "fptas"], default="auto",
+                   help="auto — solve_meals обирає за розміром задачі")
+    p.add_argument("--eps", type=float, default=0.01, help="Точність FPTAS")
+    p.set_defaults(func=cmd_knapsack)
+
+    p = sub.add_parser("dice", parents=[common], help="Монте-Карло для кубиків")
+    p.add_argument("-n", "--n_rolls", type=int, default=100000, help="К-ть кидків")
+    p.add_argument("--engine", choices=["python", "numpy"], default="python", help="Рушій симуляції")
+    p.add_argument("--workers", type=int, default=1, help="К-ть процесів (numpy)")
+    p.add_argument("--dice", type=int, default=2, help="К-ть кубиків")
+    p.add_argument("--faces", type=int, default=6, help="К-ть граней")
+    p.add_argument("--target-error", type=float, default=None,
+                   help="Кидати, доки півширина 95%% довірчого інтервалу не стане меншою")
+    p.add_argument("--plot", action="store_true", help="Показати графік порівняння")
+    p.set_defaults(func=cmd_dice)
+
+    p = sub.add_parser("fractal", parents=[common], help="Дерево Піфагора")
+    p.add_argument("-d", "--depth", type=int, default=10, help="Рівень рекурсії")
+    p.add_argument("-l", "--length", type=float, default=200.0, help="Початкова довжина стовбура")
+    p.add_argument("--engine", choices=["auto", "recursive", "batched"], default="auto")
+    p.add_argument("--lod", type=float, default=1.0, help="Мінімальна довжина гілки в пікселях (batched)")
+    p.add_argument("--save", default=None, help="Зберегти зображення у файл замість вікна")
+    p.set_defaults(func=cmd_fractal)
+
+    p = sub.add_parser("traversal", parents=[common], help="Обходи бінарного дерева")
+    p.add_argument("--mode", default="bfs", choices=["bfs", "dfs", "preorder", "inorder", "postorder"])
+    p.add_argument("--nodes", type=int, default=None, help="Повне дерево з N вузлів замість прикладу")
+    p.add_argument("--animate", action="store_true", help="Показати анімацію обходу")
+    p.add_argument("--save", default=None, help="Зберегти анімацію у файл (.gif або відео)")
+    p.add_argument("--pause", type=float, default=0.6, help="Пауза між кроками (сек)")
+    p.add_argument("--fps", type=int, default=2, help="Кадрів на секунду для --save")
+    p.set_defaults(func=cmd_traversal)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Пакетний Дейкстра для багатьох джерел у пулі процесів.
+
+Реалізація:
+  - Граф компілюється у CSRGraph, а його масиви offsets / targets / weights
+    один раз копіюються у спільну пам'ять (multiprocessing.shared_memory).
+  - Кожен процес-працівник під'єднується до неї в initializer, тож задача
+    передає лише індекс джерела, а не весь граф.
+  - Результати повертаються в міру готовності (генератор), у вигляді
+    (джерело, array('d') відстаней у порядку csr.ids).
+
+Python 3.10+
+"""
+
+from __future__ import annotations
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+import os
+
+from dijkstra_heap import Graph, CSRGraph
+
+# Стан процесу-працівника: CSR поверх спільної пам'яті
+_worker_graph: Optional[CSRGraph] = None
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+
+def _share(arr: array) -> shared_memory.SharedMemory:
+    nbytes = len(arr) * arr.itemsize
+    # Блок нульового розміру створити не можна
+    shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+    if nbytes:
+        shm.buf[:nbytes] = memoryview(arr).cast("B")
+    return shm
+
+
+def _attach(name: str, typecode: str, length: int) -> memoryview:
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_blocks.append(shm)
+    return shm.buf[:length * array(typecode).itemsize].cast(typecode)
+
+
+def _init_worker(directed: bool, layout: List[Tuple[str, str, int]]) -> None:
+    global _worker_graph
+    offsets, targets, weights = (_attach(*spec) for spec in layout)
+    # ids/index у працівнику не потрібні: він працює лише з індексами вершин
+    _worker_graph = CSRGraph(directed, (), {}, offsets, targets, weights)
+
+
+def _run_source(s: int) -> Tuple[int, array]:
+    dist, _ = _worker_graph.dijkstra_indices(s)
+    return s, array("d", dist)
+
+
+def batch_dijkstra(graph: Graph | CSRGraph, sources: Iterable[Any],
+                   max_workers: Optional[int] = None) -> Iterator[Tuple[Any, array]]:
+    """
+    Для кожного джерела повертає (source, dist), де dist[i] — відстань до
+    вершини csr.ids[i]. Порядок видачі — порядок завершення, а не sources.
+    max_workers=1 рахує в поточному процесі без пулу. Джерела перевіряються
+    одразу (KeyError під час виклику, а не на першому next()); якщо генератор
+    закрито достроково, ще не розпочаті задачі скасовуються.
+    """
+    csr = graph.compile() if isinstance(graph, Graph) else graph
+    indices = []
+    for s in sources:
+        if s not in csr.index:
+            raise KeyError(f"Початкова вершина {s!r} відсутня у графі.")
+        indices.append(csr.index[s])
+    return _batch_results(csr, indices, max_workers or os.cpu_count() or 1)
+
+
+def _batch_results(csr: CSRGraph, indices: List[int], workers: int) -> Iterator[Tuple[Any, array]]:
+    if workers == 1 or len(indices) <= 1:
+        for i in indices:
+            dist, _ = csr.dijkstra_indices(i)
+            yield csr.ids[i], array("d", dist)
+        return
+
+    blocks = [_share(csr.offsets), _share(csr.targets), _share(csr.weights)]
+    pool = None
+    try:
+        layout = [(shm.name, arr.typecode, len(arr))
+                  for shm, arr in zip(blocks, (csr.offsets, csr.targets, csr.weights))]
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(csr.directed, layout))
+        futures = [pool.submit(_run_source, i) for i in indices]
+        for fut in as_completed(futures):
+            i, dist = fut.result()
+            yield csr.ids[i], dist
+    finally:
+        # break / close() / виняток у споживача: черга задач скасовується, а
+        # close() не чекає задач, що вже виконуються, — працівники завершать
+        # їх у фоні (спільна пам'ять лишається в них підключеною після unlink)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def distance_table(graph: Graph | CSRGraph, sources: Iterable[Any],
+                   max_workers: Optional[int] = None) -> dict[Any, array]:
+    """Зручна обгортка: словник source -> масив відстаней."""
+    return dict(batch_dijkstra(graph, sources, max_workers))
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(42)
+    n = 20000
+    g = Graph(directed=True)
+    for _ in range(5 * n):
+        g.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(1, 100))
+    csr = g.compile()
+    sources = rng.sample(csr.vertices(), 32)
+
+    for workers in sorted({1, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        table = distance_table(csr, sources, max_workers=workers)
+        print(f"Процесів: {workers:>2}, джерел: {len(table)}, "
+              f"час: {time.perf_counter() - start:.2f} с")
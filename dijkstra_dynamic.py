@@ -0,0 +1,113 @@
+"""
+Динамічний Дейкстра (одне джерело) для графа, що лише "покращується".
+
+Реалізація:
+  - DynamicSSSP зберігає dist/prev для фіксованого джерела.
+  - Після вставки ребра або зменшення його ваги відстані можуть лише
+    зменшитися, тож достатньо запустити Дейкстру від кінця зміненого ребра
+    і поширити покращення: обробляються тільки вершини, чия відстань
+    справді змінилася, а не весь граф.
+  - Відстані завжди збігаються з новим запуском Graph.dijkstra; prev — коректне
+    дерево найкоротших шляхів (серед рівних шляхів може бути обраний інший).
+
+Python 3.10+
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+
+from dijkstra_heap import Graph
+
+
+class DynamicSSSP:
+    def __init__(self, graph: Graph, source: Any) -> None:
+        self.graph = graph
+        self.source = source
+        self.dist, self.prev = graph.dijkstra(source)
+        # Кількість вершин, оброблених під час останнього оновлення
+        self.last_repaired = 0
+
+    def insert_edge(self, u: Any, v: Any, w: float) -> int:
+        """Додає ребро в граф і оновлює відстані; повертає к-ть оброблених вершин."""
+        self.graph.add_edge(u, v, w)
+        for x in (u, v):
+            if x not in self.dist:
+                self.dist[x] = float('inf')
+                self.prev[x] = None
+        return self._repair(self._seeds(u, v, w))
+
+    def decrease_weight(self, u: Any, v: Any, w: float) -> int:
+        """Зменшує вагу ребра u -> v і оновлює відстані."""
+        self.graph.decrease_weight(u, v, w)
+        return self._repair(self._seeds(u, v, w))
+
+    def _seeds(self, u: Any, v: Any, w: float) -> List[Tuple[float, Any]]:
+        seeds = []
+        ends = [(u, v)] if self.graph.directed else [(u, v), (v, u)]
+        for a, b in ends:
+            alt = self.dist[a] + w
+            if alt < self.dist[b]:
+                self.dist[b] = alt
+                self.prev[b] = a
+                seeds.append((alt, b))
+        return seeds
+
+    def _repair(self, heap: List[Tuple[float, Any]]) -> int:
+        dist, prev, adj = self.dist, self.prev, self.graph.adj
+        heapq.heapify(heap)
+        repaired = 0
+        while heap:
+            d, u = heapq.heappop(heap)
+            # Застарілий запис: відстань уже покращили ще раз
+            if d > dist[u]:
+                continue
+            repaired += 1
+            for v, w in adj[u]:
+                alt = d + w
+                if alt < dist[v]:
+                    dist[v] = alt
+                    prev[v] = u
+                    heapq.heappush(heap, (alt, v))
+        self.last_repaired = repaired
+        return repaired
+
+    def distances(self) -> Dict[Any, float]:
+        return self.dist
+
+    def path_to(self, target: Any) -> list[Any]:
+        if self.dist.get(target, float('inf')) == float('inf'):
+            return []
+        path = []
+        cur: Optional[Any] = target
+        while cur is not None:
+            path.append(cur)
+            cur = self.prev[cur]
+        path.reverse()
+        return path
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(1)
+    n = 50000
+    g = Graph(directed=True)
+    for _ in range(4 * n):
+        g.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(10, 100))
+
+    start = time.perf_counter()
+    sssp = DynamicSSSP(g, 0)
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    touched = 0
+    for _ in range(100):
+        touched += sssp.insert_edge(rng.randrange(n), rng.randrange(n), rng.randint(10, 100))
+    incremental = (time.perf_counter() - start) / 100
+
+    print(f"Повний Дейкстра: {full * 1000:.1f} мс")
+    print(f"Одна вставка ребра: {incremental * 1000:.3f} мс, "
+          f"у середньому оброблено вершин: {touched / 100:.1f}")
+    print("Збіг із новим запуском:", sssp.dist == g.dijkstra(0)[0])
@@ -6,35 +6,114 @@
   - Орієнтований/неорієнтований зважений граф через adjacency list.
   - Алгоритм Дейкстри O((V+E) log V) завдяки бінарній купі.
   - Повертає відстані, попередники та дозволяє відновити шлях.
+  - Graph.compile() будує незмінне компактне CSR-представлення (CSRGraph)
+    для великих графів: вершини інтернуються в int, а ребра зберігаються
+    у трьох масивах array (offsets / targets / weights).
+  - Черга з пріоритетом підключається параметром queue (див. priority_queues):
+    індексована бінарна / парна купа з decrease-key, черга Діала, radix-купа.
+  - shortest_path для однієї пари вершин зупиняється, щойно ціль остаточно
+    оброблена; опційно — двонаправлений пошук (від джерела та від цілі
+    по оберненому графу).
+  - Під instrumentation.record() dijkstra звітує про кількість push/pop,
+    застарілих pop і релаксацій.
 
 Python 3.10+
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Any, Optional, Iterable
+from functools import cached_property
+from typing import Dict, List, Tuple, Any, Optional, Iterable, Callable
+from array import array
 import heapq
+import sys
+import time
+
+from instrumentation import recorder
+from lazy_numpy import import_numpy
+from priority_queues import make_queue
+
+def _counting(push: Callable[..., None], counter: List[int]) -> Callable[..., None]:
+    """Обгортка push, що додає 1 до counter[0] при кожному виклику (для record())."""
+    def wrapped(*args: Any) -> None:
+        counter[0] += 1
+        push(*args)
+    return wrapped
 
 @dataclass
 class Graph:
     directed: bool = False
     # Список суміжності: вершина -> список (сусід, вага)
     adj: Dict[Any, List[Tuple[Any, float]]] = field(default_factory=dict)
+    # Кеш оберненого списку суміжності (лише для орієнтованого графа)
+    _radj: Optional[Dict[Any, List[Tuple[Any, float]]]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def add_edge(self, u: Any, v: Any, w: float) -> None:
         if w < 0:
             raise ValueError("Алгоритм Дейкстри не працює з від'ємними вагами.")
+        self._radj = None
         self.adj.setdefault(u, []).append((v, w))
         self.adj.setdefault(v, [])
         if not self.directed:
             self.adj[v].append((u, w))
 
+    def decrease_weight(self, u: Any, v: Any, w: float) -> float:
+        """Зменшує вагу ребра u -> v (найлегшого з паралельних); повертає стару вагу."""
+        if w < 0:
+            raise ValueError("Алгоритм Дейкстри не працює з від'ємними вагами.")
+        edges = self.adj.get(u, [])
+        found = [k for k, (x, _) in enumerate(edges) if x == v]
+        if not found:
+            raise KeyError(f"Ребро {u!r} -> {v!r} відсутнє у графі.")
+        k = min(found, key=lambda k: edges[k][1])
+        old = edges[k][1]
+        if w > old:
+            raise ValueError("Вагу ребра можна лише зменшити.")
+        self._radj = None
+        edges[k] = (v, w)
+        if not self.directed:
+            back = self.adj[v]
+            back[back.index((u, old))] = (u, w)
+        return old
+
     def vertices(self) -> List[Any]:
         return list(self.adj.keys())
 
-    def dijkstra(self, source: Any) -> tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    def reverse_adj(self) -> Dict[Any, List[Tuple[Any, float]]]:
+        """Обернений список суміжності: v -> [(u, w)] для кожного ребра u -> v."""
+        if not self.directed:
+            return self.adj
+        if self._radj is None:
+            radj: Dict[Any, List[Tuple[Any, float]]] = {v: [] for v in self.adj}
+            for u, edges in self.adj.items():
+                for v, w in edges:
+                    radj[v].append((u, w))
+            self._radj = radj
+        return self._radj
+
+    def compile(self) -> "CSRGraph":
+        """Повертає незмінний CSR-знімок графа (див. CSRGraph)."""
+        return CSRGraph.from_graph(self)
+
+    def dijkstra(self, source: Any, target: Optional[Any] = None,
+                 queue: Optional[str] = None) -> tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+        """
+        Якщо задано target, пошук зупиняється, щойно target вийнято з купи:
+        його dist і ланцюжок prev уже остаточні, решта значень — проміжні.
+        queue — назва черги з priority_queues ("binary", "pairing", "dial",
+        "radix", "auto" тощо); за замовчуванням — heapq з лінивим видаленням.
+        """
         if source not in self.adj:
             raise KeyError(f"Початкова вершина {source!r} відсутня у графі.")
+        rec = recorder()
+        if rec is not None:
+            start = time.perf_counter()
+        if queue is not None:
+            dist, prev, counts = self._dijkstra_queue(source, target, queue, rec is not None)
+            if rec is not None:
+                rec.add(Graph.dijkstra, time.perf_counter() - start, **counts)
+            return dist, prev
 
         dist: Dict[Any, float] = {v: float('inf') for v in self.adj}
         prev: Dict[Any, Optional[Any]] = {v: None for v in self.adj}
@@ -42,6 +121,11 @@ class Graph:
 
         # Мін-купа: (поточна_відстань, вершина)
         heap: list[tuple[float, Any]] = [(0.0, source)]
+        # Лише під record() push рахує виклики; інакше цикл без жодних лічильників
+        push = heapq.heappush
+        if rec is not None:
+            pushed = [0]
+            push = _counting(push, pushed)
 
         visited: set[Any] = set()
         while heap:
@@ -49,6 +133,8 @@ class Graph:
             if u in visited:
                 continue
             visited.add(u)
+            if u == target:
+                break
 
             # Якщо ми виймаємо запис із більшим d, ніж дійсний dist[u], пропускаємо
             if d > dist[u]:
@@ -59,12 +145,68 @@ class Graph:
                 if alt < dist[v]:
                     dist[v] = alt
                     prev[v] = u
-                    heapq.heappush(heap, (alt, v))
+                    push(heap, (alt, v))
 
+        if rec is not None:
+            # Кожна релаксація — один push; усе, що вийнято понад visited, — застаріле
+            relaxations = pushed[0]
+            pushes = relaxations + 1
+            pops = pushes - len(heap)
+            rec.add(Graph.dijkstra, time.perf_counter() - start, pushes=pushes, pops=pops,
+                    stale_pops=pops - len(visited), relaxations=relaxations)
         return dist, prev
 
-    def shortest_path(self, source: Any, target: Any) -> list[Any]:
-        dist, prev = self.dijkstra(source)
+    def _dijkstra_queue(self, source: Any, target: Optional[Any], queue: str,
+                        count: bool = False) -> tuple[Dict[Any, float], Dict[Any, Optional[Any]],
+                                                      Optional[Dict[str, int]]]:
+        weights = (w for edges in self.adj.values() for _, w in edges)
+        pq = make_queue(queue, weights)
+        dist: Dict[Any, float] = {v: float('inf') for v in self.adj}
+        prev: Dict[Any, Optional[Any]] = {v: None for v in self.adj}
+        dist[source] = 0.0
+        pq.push(source, 0.0)
+        push = pq.push
+        if count:
+            pushed = [0]
+            push = _counting(push, pushed)
+
+        # Черга зберігає кожну вершину не більше одного разу (decrease-key),
+        # тож застарілих записів і множини visited немає
+        while pq:
+            d, u = pq.pop()
+            if u == target:
+                break
+            for v, w in self.adj[u]:
+                alt = d + w
+                if alt < dist[v]:
+                    dist[v] = alt
+                    prev[v] = u
+                    push(v, alt)
+
+        if not count:
+            return dist, prev, None
+        # Лічильники для instrumentation: вставки — вершини зі скінченною
+        # відстанню, решта push — decrease-key
+        relaxations = pushed[0]
+        reached = sum(1 for d in dist.values() if d != float('inf'))
+        counts = {"pushes": relaxations + 1, "pops": reached - len(pq), "stale_pops": 0,
+                  "decrease_keys": relaxations + 1 - reached, "relaxations": relaxations}
+        return dist, prev, counts
+
+    def shortest_path(self, source: Any, target: Any, bidirectional: bool = False) -> list[Any]:
+        """
+        Найкоротший шлях source -> target (порожній список, якщо недосяжна).
+        bidirectional=True запускає зустрічний пошук; довжина шляху та сама,
+        але серед кількох рівних за довжиною шляхів може бути обраний інший.
+        """
+        if bidirectional:
+            if source not in self.adj:
+                raise KeyError(f"Початкова вершина {source!r} відсутня у графі.")
+            if target not in self.adj:
+                raise KeyError(target)
+            radj = self.reverse_adj()
+            return bidirectional_search(self.adj.__getitem__, radj.__getitem__, source, target)
+        dist, prev = self.dijkstra(source, target)
         if dist[target] == float('inf'):
             return []
         # Відновлення шляху
@@ -76,6 +218,267 @@ class Graph:
         path.reverse()
         return path
 
+
+def bidirectional_search(forward: Callable[[Any], Iterable[Tuple[Any, float]]],
+                         backward: Callable[[Any], Iterable[Tuple[Any, float]]],
+                         source: Any, target: Any) -> list[Any]:
+    """
+    Двонаправлений Дейкстра: по черзі розширюємо меншу з двох хвиль (від
+    source по forward і від target по backward) і зупиняємося, коли сума
+    мінімумів двох куп не менша за найкращий знайдений шлях через вершину зустрічі.
+    """
+    if source == target:
+        return [source]
+    inf = float('inf')
+    dist = ({source: 0.0}, {target: 0.0})
+    prev: tuple[Dict[Any, Any], Dict[Any, Any]] = ({source: None}, {target: None})
+    heaps: tuple[list, list] = ([(0.0, source)], [(0.0, target)])
+    done: tuple[set, set] = (set(), set())
+    neighbors = (forward, backward)
+    pop, push = heapq.heappop, heapq.heappush
+
+    best, meet = inf, None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, u = pop(heaps[side])
+        if u in done[side]:
+            continue
+        done[side].add(u)
+        own, other = dist[side], dist[1 - side]
+        for v, w in neighbors[side](u):
+            alt = d + w
+            if alt < own.get(v, inf):
+                own[v] = alt
+                prev[side][v] = u
+                push(heaps[side], (alt, v))
+            if v in other and own[v] + other[v] < best:
+                best, meet = own[v] + other[v], v
+
+    if meet is None:
+        return []
+    # Частина source -> meet за прямими попередниками, далі meet -> target
+    path = []
+    cur = meet
+    while cur is not None:
+        path.append(cur)
+        cur = prev[0][cur]
+    path.reverse()
+    cur = prev[1][meet]
+    while cur is not None:
+        path.append(cur)
+        cur = prev[1][cur]
+    return path
+
+
+def _build_path(prev: List[int], target: int) -> List[int]:
+    """Відновлює шлях за масивом попередників (-1 — немає попередника)."""
+    path = []
+    cur = target
+    while cur != -1:
+        path.append(cur)
+        cur = prev[cur]
+    path.reverse()
+    return path
+
+
+@dataclass(frozen=True)
+class CSRGraph:
+    """
+    Компактний граф у форматі compressed sparse row.
+
+    Вершини пронумеровані 0..V-1 (ids[i] — вихідний ідентифікатор), ребра
+    вершини i лежать у targets/weights на позиціях offsets[i]..offsets[i+1]-1.
+    Замість dict + list + tuple на кожне ребро маємо 8 + 8 байт у масивах.
+    """
+    directed: bool
+    ids: Tuple[Any, ...]
+    index: Dict[Any, int]
+    offsets: array
+    targets: array
+    weights: array
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        ids = tuple(graph.adj)
+        index = {v: i for i, v in enumerate(ids)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        total = 0
+        for v in ids:
+            edges = graph.adj[v]
+            total += len(edges)
+            offsets.append(total)
+            targets.extend(index[t] for t, _ in edges)
+            weights.extend(w for _, w in edges)
+        return cls(graph.directed, ids, index, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, ids: Iterable[Any], src: array, dst: array, weights: array,
+                   directed: bool = False) -> "CSRGraph":
+        """
+        Будує CSR із паралельних масивів ребер (індекси вершин у ids) сортуванням
+        підрахунком. Порядок сусідів той самий, що дали б послідовні add_edge.
+        src / dst / weights — array або масиви NumPy; з NumPy offsets рахуються
+        через bincount + cumsum, а ребра впорядковуються стабільним argsort.
+        """
+        if import_numpy() is not None:
+            return cls._from_edges_np(ids, src, dst, weights, directed)
+        if weights and min(weights) < 0:
+            raise ValueError("Алгоритм Дейкстри не працює з від'ємними вагами.")
+        ids = tuple(ids)
+        n = len(ids)
+        counts = [0] * (n + 1)
+        for u in src:
+            counts[u + 1] += 1
+        if not directed:
+            for v in dst:
+                counts[v + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        m = counts[n]
+        offsets = array("q", counts)
+        fill = counts[:-1]
+        targets = array("q", bytes(8 * m))
+        out_weights = array("d", bytes(8 * m))
+        for u, v, w in zip(src, dst, weights):
+            pos = fill[u]
+            targets[pos] = v
+            out_weights[pos] = w
+            fill[u] = pos + 1
+            if not directed:
+                pos = fill[v]
+                targets[pos] = u
+                out_weights[pos] = w
+                fill[v] = pos + 1
+        index = {v: i for i, v in enumerate(ids)}
+        return cls(directed, ids, index, offsets, targets, out_weights)
+
+    @classmethod
+    def _from_edges_np(cls, ids: Iterable[Any], src: Any, dst: Any, weights: Any,
+                       directed: bool) -> "CSRGraph":
+        np = import_numpy()
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        if (weights < 0).any():
+            raise ValueError("Алгоритм Дейкстри не працює з від'ємними вагами.")
+        ids = tuple(ids)
+        if not directed:
+            # Ребро (u, v) дає записи u->v і v->u саме в такому порядку, як add_edge
+            m = len(src)
+            heads, tails = np.empty(2 * m, dtype=np.int64), np.empty(2 * m, dtype=np.int64)
+            heads[0::2], heads[1::2] = src, dst
+            tails[0::2], tails[1::2] = dst, src
+            src, dst, weights = heads, tails, np.repeat(weights, 2)
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(ids)), out=offsets[1:])
+        order = np.argsort(src, kind="stable")
+        index = {v: i for i, v in enumerate(ids)}
+        return cls(directed, ids, index, array("q", offsets.tobytes()),
+                   array("q", dst[order].tobytes()), array("d", weights[order].tobytes()))
+
+    def vertices(self) -> List[Any]:
+        return list(self.ids)
+
+    def num_edges(self) -> int:
+        """Кількість записів суміжності (неорієнтоване ребро рахується двічі)."""
+        return len(self.targets)
+
+    def nbytes(self) -> int:
+        """Приблизний обсяг пам'яті, зайнятий масивами та індексом вершин."""
+        return (sys.getsizeof(self.offsets) + sys.getsizeof(self.targets)
+                + sys.getsizeof(self.weights) + sys.getsizeof(self.ids)
+                + sys.getsizeof(self.index))
+
+    def neighbors(self, u: int) -> Iterable[Tuple[int, float]]:
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def _vertex(self, v: Any) -> int:
+        try:
+            return self.index[v]
+        except KeyError:
+            raise KeyError(f"Вершина {v!r} відсутня у графі.") from None
+
+    @cached_property
+    def transposed(self) -> "CSRGraph":
+        """Транспонований CSR (ребра u -> v стають v -> u); неорієнтований — сам граф."""
+        if not self.directed:
+            return self
+        n = len(self.ids)
+        counts = [0] * (n + 1)
+        for v in self.targets:
+            counts[v + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array("q", counts)
+        fill = counts[:-1]
+        targets = array("q", bytes(8 * len(self.targets)))
+        weights = array("d", bytes(8 * len(self.weights)))
+        for u in range(n):
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[k]
+                pos = fill[v]
+                targets[pos] = u
+                weights[pos] = self.weights[k]
+                fill[v] = pos + 1
+        return CSRGraph(True, self.ids, self.index, offsets, targets, weights)
+
+    def dijkstra_indices(self, s: int, t: int = -1) -> tuple[List[float], List[int]]:
+        """
+        Дейкстра по внутрішніх індексах: повертає списки dist і prev (-1 — немає).
+        t >= 0 — зупинитися, щойно вершину t остаточно оброблено.
+        """
+        n = len(self.offsets) - 1
+        dist = [float('inf')] * n
+        prev = [-1] * n
+        dist[s] = 0.0
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        pop, push = heapq.heappop, heapq.heappush
+
+        heap: list[tuple[float, int]] = [(0.0, s)]
+        while heap:
+            d, u = pop(heap)
+            # Застарілий запис: вершину вже виймали з меншою відстанню
+            if d > dist[u]:
+                continue
+            if u == t:
+                break
+            lo, hi = offsets[u], offsets[u + 1]
+            for v, w in zip(targets[lo:hi], weights[lo:hi]):
+                alt = d + w
+                if alt < dist[v]:
+                    dist[v] = alt
+                    prev[v] = u
+                    push(heap, (alt, v))
+
+        return dist, prev
+
+    def dijkstra(self, source: Any) -> tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+        if source not in self.index:
+            raise KeyError(f"Початкова вершина {source!r} відсутня у графі.")
+        dist, prev = self.dijkstra_indices(self.index[source])
+        ids = self.ids
+        return (dict(zip(ids, dist)),
+                {ids[i]: (ids[p] if p != -1 else None) for i, p in enumerate(prev)})
+
+    def shortest_path(self, source: Any, target: Any, bidirectional: bool = False) -> list[Any]:
+        if source not in self.index:
+            raise KeyError(f"Початкова вершина {source!r} відсутня у графі.")
+        t = self._vertex(target)
+        if bidirectional:
+            path = bidirectional_search(self.neighbors, self.transposed.neighbors,
+                                        self.index[source], t)
+            return [self.ids[i] for i in path]
+        dist, prev = self.dijkstra_indices(self.index[source], t)
+        if dist[t] == float('inf'):
+            return []
+        return [self.ids[i] for i in _build_path(prev, t)]
+
+
 if __name__ == "__main__":
     # Демонстрація роботи на невеликому графі
     g = Graph(directed=False)
@@ -94,3 +497,32 @@ if __name__ == "__main__":
     for v in sorted(g.vertices()):
         print(f"  A -> {v}: {dist[v]}")
     print("\nНайкоротший шлях A -> Z:", " -> ".join(g.shortest_path("A","Z")))
+
+    csr = g.compile()
+    print("CSR: вершин =", len(csr.ids), "записів суміжності =", csr.num_edges(),
+          "байт =", csr.nbytes())
+    print("CSR шлях A -> Z:", " -> ".join(csr.shortest_path("A","Z")))
+    print("Двонаправлений A -> Z:", " -> ".join(g.shortest_path("A","Z", bidirectional=True)))
+
+    # Перевірка черг з priority_queues проти heapq: повний прохід і ранній
+    # вихід за target, на цілих і дробових вагах ("dial"/"radix" — лише цілі)
+    import random
+    from priority_queues import QUEUES
+    rng = random.Random(7)
+    for integral in (True, False):
+        rg = Graph(directed=True)
+        for _ in range(600):
+            w = rng.randint(0, 20) if integral else rng.uniform(0, 5)
+            rg.add_edge(rng.randrange(100), rng.randrange(100), w)
+        src = next(iter(rg.adj))
+        for q in QUEUES:
+            if not integral and q in ("dial", "radix"):
+                try:
+                    rg.dijkstra(src, queue=q)
+                except ValueError:
+                    continue
+                raise AssertionError(f"{q}: дробові ваги мали бути відхилені")
+            assert rg.dijkstra(src, queue=q)[0] == rg.dijkstra(src)[0], q
+            for t in rg.vertices():
+                assert rg.dijkstra(src, t, queue=q)[0][t] == rg.dijkstra(src, t)[0][t], (q, t)
+    print("Черги", ", ".join(QUEUES), "збігаються з heapq (з target і без)")
@@ -0,0 +1,311 @@
+"""
+Масове завантаження графів для dijkstra_heap без поребрового Graph.add_edge.
+
+Реалізація:
+  - load_edge_list: CSV/TSV ("u<роздільник>v<роздільник>w" на рядок), файл
+    відображається у пам'ять (mmap) і розбирається шматками по межах рядків.
+  - load_binary_edges: двійковий формат ребер — послідовність записів
+    <int64 u, int64 v, float64 w> (little-endian), теж через mmap.
+  - З NumPy шматки розбираються векторно: текст — np.loadtxt, двійкові
+    записи — np.frombuffer без копіювання; ідентифікатори вершин
+    нумеруються через np.unique, ваги перевіряються (w < 0).any(), а
+    CSRGraph.from_edges будує CSR через bincount + стабільний argsort.
+    Без NumPy — той самий результат поелементними циклами.
+  - save_snapshot / load_snapshot: двійковий знімок готового CSRGraph
+    (масиви пишуться та читаються напряму, без розбору тексту).
+
+Python 3.10+
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+import io
+import mmap
+import os
+import pickle
+import struct
+import sys
+import warnings
+
+from dijkstra_heap import CSRGraph
+from lazy_numpy import import_numpy
+
+EDGE_RECORD = struct.Struct("<qqd")
+EDGE_DTYPE = [("u", "<i8"), ("v", "<i8"), ("w", "<f8")]  # той самий запис для np.frombuffer
+_SNAPSHOT_MAGIC = b"CSRGRAPH"
+_SNAPSHOT_HEADER = struct.Struct("<8sBqqq")  # magic, directed, n, m, довжина ids
+
+
+def _chunks(path: str, chunk_size: int, align: Callable[[mmap.mmap, int], int]) -> Iterator[bytes]:
+    """Шматки файлу розміром ~chunk_size; align зсуває межу шматка до межі запису."""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Порожній файл не можна відобразити
+            return
+        with mm:
+            pos, size = 0, len(mm)
+            while pos < size:
+                end = align(mm, min(pos + chunk_size, size))
+                yield mm[pos:end]
+                pos = end
+
+
+def _check_weights(weights: array, first_record: int) -> None:
+    if weights and min(weights) < 0:
+        bad = next(i for i, w in enumerate(weights) if w < 0)
+        raise ValueError(f"Запис {first_record + bad}: від'ємна вага {weights[bad]!r} "
+                         "(алгоритм Дейкстри не працює з від'ємними вагами).")
+
+
+def _check_weights_np(w, first_record: int) -> None:
+    if (w < 0).any():
+        bad = int(import_numpy().flatnonzero(w < 0)[0])
+        raise ValueError(f"Запис {first_record + bad}: від'ємна вага {float(w[bad])!r} "
+                         "(алгоритм Дейкстри не працює з від'ємними вагами).")
+
+
+def _intern_np(endpoints, vertex_type: Callable[[Any], Any] | None = None):
+    """
+    Нумерує вершини в порядку першої появи, як _Interner, але через np.unique:
+    endpoints — кінці ребер у порядку u0, v0, u1, v1, ...
+    vertex_type застосовується лише до унікальних значень; якщо після нього
+    різні рядки збіглися (наприклад, " A" і "A"), їхні номери зливаються.
+    Повертає (ids, src, dst) з src/dst — масивами int64.
+    """
+    np = import_numpy()
+    if endpoints.dtype.kind == "i" and len(endpoints) and \
+            0 <= endpoints.min() and endpoints.max() < 4 * len(endpoints):
+        # Щільні невід'ємні цілі id: таблиця першої появи замість сортування
+        first = np.full(int(endpoints.max()) + 1, len(endpoints), dtype=np.int64)
+        np.minimum.at(first, endpoints, np.arange(len(endpoints)))
+        uniq = np.flatnonzero(first < len(endpoints))
+        order = np.argsort(first[uniq], kind="stable")
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[uniq[order]] = np.arange(len(uniq))
+        inv = rank[endpoints]
+    else:
+        uniq, first, inv = np.unique(endpoints, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        rank = np.empty(len(uniq), dtype=np.int64)
+        rank[order] = np.arange(len(uniq))
+        inv = rank[inv.ravel()]
+    values = uniq[order].tolist()
+    if vertex_type is not None:
+        values = [vertex_type(x) for x in values]
+        index: Dict[Any, int] = {}
+        remap = np.array([index.setdefault(x, len(index)) for x in values], dtype=np.int64)
+        if len(index) < len(values):
+            inv = remap[inv]
+            values = list(index)
+    return values, inv[0::2], inv[1::2]
+
+
+def _interleave(u, v):
+    out = import_numpy().empty(2 * len(u), dtype=u.dtype)
+    out[0::2], out[1::2] = u, v
+    return out
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.index: Dict[Any, int] = {}
+        self.ids: list[Any] = []
+
+    def __call__(self, v: Any) -> int:
+        i = self.index.get(v)
+        if i is None:
+            i = self.index[v] = len(self.ids)
+            self.ids.append(v)
+        return i
+
+
+def load_edge_list(path: str, directed: bool = False, delimiter: str | None = None,
+                   has_header: bool = False, vertex_type: Callable[[str], Any] = str,
+                   chunk_size: int = 1 << 22, encoding: str = "utf-8") -> CSRGraph:
+    """
+    Читає текстовий список ребер у CSRGraph. delimiter=None — будь-які
+    пробільні символи (TSV/пробіли), для CSV передайте ",".
+    Порожні рядки та рядки, що починаються з '#', пропускаються.
+    """
+    def align(mm: mmap.mmap, end: int) -> int:
+        if end >= len(mm):
+            return end
+        nl = mm.find(b"\n", end)
+        return len(mm) if nl < 0 else nl + 1
+
+    # Без NumPy ребра розбираються поелементно
+    if import_numpy() is not None:
+        return _load_edge_list_np(path, directed, delimiter, has_header, vertex_type,
+                                  chunk_size, encoding, align)
+    intern = _Interner()
+    src, dst, weights = array("q"), array("q"), array("d")
+    skip_header = has_header
+    for chunk in _chunks(path, chunk_size, align):
+        lines = chunk.decode(encoding).splitlines()
+        if skip_header and lines:
+            lines = lines[1:]
+            skip_header = False
+        chunk_w = array("d")
+        first = len(weights)
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            u, v, w = line.split(delimiter)[:3]
+            src.append(intern(vertex_type(u.strip())))
+            dst.append(intern(vertex_type(v.strip())))
+            chunk_w.append(float(w))
+        _check_weights(chunk_w, first)
+        weights.extend(chunk_w)
+    return CSRGraph.from_edges(intern.ids, src, dst, weights, directed)
+
+
+def _load_edge_list_np(path, directed, delimiter, has_header, vertex_type,
+                       chunk_size, encoding, align) -> CSRGraph:
+    np = import_numpy()
+    # Цілі ідентифікатори розбираються одразу в int64, інші — як рядки
+    numeric = vertex_type is int
+    us, vs, ws = [], [], []
+    first = 0
+    skip_header = has_header
+    for chunk in _chunks(path, chunk_size, align):
+        if numeric:
+            dtype = EDGE_DTYPE
+        else:
+            # Вага одразу розбирається як число; ширина рядків id — найдовший рядок шматка
+            width = max(map(len, chunk.splitlines()), default=1)
+            dtype = [("u", f"U{width}"), ("v", f"U{width}"), ("w", "<f8")]
+        with warnings.catch_warnings():
+            # Шматок лише з коментарів чи порожніх рядків — не помилка
+            warnings.simplefilter("ignore", UserWarning)
+            rows = np.loadtxt(io.BytesIO(chunk), dtype=dtype, delimiter=delimiter, comments="#",
+                              skiprows=1 if skip_header else 0, usecols=(0, 1, 2),
+                              encoding=encoding, ndmin=1)
+        skip_header = False
+        u, v, w = rows["u"], rows["v"], rows["w"]
+        _check_weights_np(w, first)
+        first += len(w)
+        us.append(u)
+        vs.append(v)
+        ws.append(w)
+    if not ws:
+        return CSRGraph.from_edges((), array("q"), array("q"), array("d"), directed)
+    u, v, w = np.concatenate(us), np.concatenate(vs), np.concatenate(ws)
+    endpoints = _interleave(u, v)
+    convert = None
+    if not numeric:
+        # Стискаємо рядки до найдовшого id: коротші рядки швидше сортуються в np.unique
+        width = int(np.char.str_len(endpoints).max()) if len(endpoints) else 1
+        endpoints = endpoints.astype(f"U{max(width, 1)}")
+        convert = lambda x: vertex_type(x.strip())
+    ids, src, dst = _intern_np(endpoints, convert)
+    return CSRGraph.from_edges(ids, src, dst, w, directed)
+
+
+def write_binary_edges(path: str, edges: Iterable[Tuple[int, int, float]]) -> None:
+    """Записує ребра у двійковий формат EDGE_RECORD."""
+    with open(path, "wb") as f:
+        for u, v, w in edges:
+            f.write(EDGE_RECORD.pack(u, v, w))
+
+
+def load_binary_edges(path: str, directed: bool = False,
+                      chunk_size: int = 1 << 22) -> CSRGraph:
+    """Читає двійковий формат EDGE_RECORD; ідентифікатори вершин — int."""
+    rec = EDGE_RECORD.size
+    chunk_size = max(rec, chunk_size - chunk_size % rec)
+
+    if os.path.getsize(path) % rec:
+        raise ValueError(f"Розмір файлу {path!r} не кратний {rec} байтам.")
+
+    np = import_numpy()
+    if np is not None:
+        parts, first = [], 0
+        for chunk in _chunks(path, chunk_size, lambda mm, end: end):
+            records = np.frombuffer(chunk, dtype=EDGE_DTYPE)
+            _check_weights_np(records["w"], first)
+            first += len(records)
+            parts.append(records)
+        records = np.concatenate(parts) if parts else np.empty(0, dtype=EDGE_DTYPE)
+        ids, src, dst = _intern_np(_interleave(records["u"], records["v"]))
+        return CSRGraph.from_edges(ids, src, dst, records["w"], directed)
+
+    intern = _Interner()
+    src, dst, weights = array("q"), array("q"), array("d")
+    for chunk in _chunks(path, chunk_size, lambda mm, end: end):
+        first = len(weights)
+        chunk_w = array("d")
+        for u, v, w in EDGE_RECORD.iter_unpack(chunk):
+            src.append(intern(u))
+            dst.append(intern(v))
+            chunk_w.append(w)
+        _check_weights(chunk_w, first)
+        weights.extend(chunk_w)
+    return CSRGraph.from_edges(intern.ids, src, dst, weights, directed)
+
+
+def save_snapshot(graph: CSRGraph, path: str) -> None:
+    """Зберігає CSRGraph: заголовок, сирі масиви offsets/targets/weights, ids (pickle)."""
+    ids_blob = pickle.dumps(graph.ids, protocol=pickle.HIGHEST_PROTOCOL)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if sys.byteorder != "little":
+        offsets, targets, weights = (array(a.typecode, a) for a in (offsets, targets, weights))
+        for a in (offsets, targets, weights):
+            a.byteswap()
+    with open(path, "wb") as f:
+        f.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, graph.directed, len(graph.ids),
+                                      len(graph.targets), len(ids_blob)))
+        offsets.tofile(f)
+        targets.tofile(f)
+        weights.tofile(f)
+        f.write(ids_blob)
+
+
+def load_snapshot(path: str) -> CSRGraph:
+    with open(path, "rb") as f:
+        magic, directed, n, m, ids_len = _SNAPSHOT_HEADER.unpack(f.read(_SNAPSHOT_HEADER.size))
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError(f"{path!r} не є знімком CSRGraph.")
+        offsets, targets, weights = array("q"), array("q"), array("d")
+        offsets.fromfile(f, n + 1)
+        targets.fromfile(f, m)
+        weights.fromfile(f, m)
+        ids = pickle.loads(f.read(ids_len))
+    if sys.byteorder != "little":
+        for a in (offsets, targets, weights):
+            a.byteswap()
+    index = {v: i for i, v in enumerate(ids)}
+    return CSRGraph(bool(directed), ids, index, offsets, targets, weights)
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(0)
+    n, m = 100000, 500000
+    edges = [(rng.randrange(n), rng.randrange(n), float(rng.randint(1, 100))) for _ in range(m)]
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv = os.path.join(tmp, "edges.tsv")
+        binary = os.path.join(tmp, "edges.bin")
+        snap = os.path.join(tmp, "graph.csr")
+        with open(tsv, "w") as f:
+            f.writelines(f"{u}\t{v}\t{w}\n" for u, v, w in edges)
+        write_binary_edges(binary, edges)
+
+        for name, load in (("TSV", lambda: load_edge_list(tsv, directed=True, vertex_type=int)),
+                           ("bin", lambda: load_binary_edges(binary, directed=True))):
+            start = time.perf_counter()
+            g = load()
+            print(f"{name}: {len(g.ids)} вершин, {g.num_edges()} ребер, "
+                  f"{time.perf_counter() - start:.2f} с")
+
+        save_snapshot(g, snap)
+        start = time.perf_counter()
+        g2 = load_snapshot(snap)
+        print(f"Знімок: {os.path.getsize(snap)} байт, завантаження "
+              f"{time.perf_counter() - start:.3f} с, збіг: {g2 == g}")
@@ -1,7 +1,25 @@
 
+"""
+Візуалізація бінарної купи, заданої масивом.
+
+draw_heap_from_array будує дерево з Node і малює його через networkx — це
+зручно для кількох десятків елементів. Для купи на 10^5–10^6 елементів є
+варіант без вузлів: heap_layout обчислює координати індексу i прямо з його
+рівня і позиції на рівні (векторно в NumPy), а draw_heap_batched малює всі
+ребра однією LineCollection і згортає піддерева, глибші за max_depth.
+networkx і matplotlib імпортуються лише у функціях малювання.
+"""
+
+import math
 import uuid
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+import heapq
+import random
+
+from lazy_numpy import HAS_NUMPY, import_numpy
+
+# Від такого розміру масиву draw_heap_from_array(engine="auto") малює без networkx
+BATCHED_MIN_SIZE = 256
 
 class Node:
     def __init__(self, key, color="#87CEEB"):
@@ -39,11 +57,136 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
             add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
     return graph
 
-def draw_heap_from_array(arr, title="Бінарна купа (піраміда)"):
+def heap_layout(n, max_depth=None):
+    """
+    Координати перших вузлів купи з n елементів без рекурсії. Для індексу i
+    рівень level = floor(log2(i+1)), позиція на рівні pos = i+1 - 2^level,
+    x = (2*pos + 1) / 2^level - 1, y = -level — ті самі точки, що дає add_edges.
+    Показуються лише рівні 0..max_depth (None — усі); вузол рівня max_depth,
+    у якого є діти, стає згорнутим.
+    Повертає (x, y, hidden) для індексів 0..m-1, де hidden[i] — кількість
+    прихованих нащадків i (0 для звичайних вузлів).
+    """
+    np = import_numpy()
+    if np is None:
+        raise ImportError("heap_layout потребує NumPy: pip install numpy")
+    height = max(n, 1).bit_length() - 1
+    depth = height if max_depth is None else min(max_depth, height)
+    m = min(n, (1 << (depth + 1)) - 1)
+    idx = np.arange(m, dtype=np.int64)
+    level = np.zeros(m, dtype=np.int64)
+    if m:
+        # frexp дає точний показник степеня двійки, на відміну від log2 у float
+        level = np.frexp((idx + 1).astype(np.float64))[1].astype(np.int64) - 1
+    scale = np.ldexp(1.0, -level)
+    x = (2 * (idx + 1 - (1 << level)) + 1) * scale - 1
+    y = -level.astype(np.float64)
+    hidden = np.zeros(m, dtype=np.int64)
+    if depth < height:
+        # Піддерево вузла i на відстані d займає індекси [(i+1)*2^d - 1, +2^d)
+        first = (1 << depth) - 1
+        roots = idx[first:] + 1
+        for d in range(1, height - depth + 1):
+            hidden[first:] += np.clip(n - ((roots << d) - 1), 0, 1 << d)
+    return x, y, hidden
+
+def _as_floats(keys):
+    # Лише справді числові значення: рядок "3" порівнюється як рядок, не як число
+    np = import_numpy()
+    try:
+        values = np.asarray(keys)
+    except ValueError:
+        return None
+    if values.ndim != 1 or values.dtype.kind not in "biuf":
+        return None
+    return values.astype(float)
+
+def _colour_values(items):
+    """
+    Числа для кольору вузлів і підпис шкали: самі значення, якщо вони
+    числові; пріоритет item[0] для пар (пріоритет, елемент); інакше ранг
+    значення серед показаних (рядки тощо) або індекс, якщо вони непорівнювані.
+    """
+    np = import_numpy()
+    values = _as_floats(items)
+    if values is not None:
+        return values, "Значення"
+    if all(isinstance(item, tuple) and item for item in items):
+        values = _as_floats([item[0] for item in items])
+        if values is not None:
+            return values, "Пріоритет"
+    try:
+        order = sorted(range(len(items)), key=items.__getitem__)
+    except TypeError:
+        return np.arange(len(items), dtype=float), "Індекс"
+    ranks = np.empty(len(items), dtype=float)
+    ranks[order] = np.arange(len(items))
+    return ranks, "Ранг"
+
+def draw_heap_batched(ax, arr, max_depth=None, min_px=3.0, label_limit=63):
+    """
+    Малює купу без Node і networkx: ребра — одна LineCollection, вузли — один
+    scatter з кольором за значенням (для кортежів і рядків — за пріоритетом
+    чи рангом, див. _colour_values). max_depth=None обирає глибину, за якої
+    сусідні вузли нижнього рівня стоять не ближче min_px пікселів; глибші
+    піддерева згортаються в трикутник (з підписом +k, якщо вузлів мало).
+    Значення підписуються, лише коли видимих вузлів не більше label_limit.
+    """
+    from matplotlib.collections import LineCollection
+    np = import_numpy()
+    n = len(arr)
+    if n == 0:
+        raise ValueError("Порожній масив.")
+    if max_depth is None:
+        fig = ax.figure
+        width_px = fig.get_figwidth() * fig.dpi * ax.get_position().width
+        max_depth = max(0, int(math.log2(max(width_px / min_px, 1))) - 1)
+    x, y, hidden = heap_layout(n, max_depth)
+    m = x.size
+    child = np.arange(1, m)
+    parent = (child - 1) >> 1
+    segments = np.stack([np.column_stack([x[parent], y[parent]]),
+                         np.column_stack([x[child], y[child]])], axis=1)
+    ax.add_collection(LineCollection(segments, colors="#9AA5B1", linewidths=0.5))
+    values, label = _colour_values(list(arr[:m]))
+    size = max(4.0, min(600.0, 40000.0 / m))
+    shown = hidden == 0
+    vmin, vmax = values.min(), values.max()
+    points = ax.scatter(x[shown], y[shown], c=values[shown], s=size, vmin=vmin, vmax=vmax,
+                        zorder=2, label=label)
+    collapsed = ~shown
+    if collapsed.any():
+        ax.scatter(x[collapsed], y[collapsed], c=values[collapsed], s=size, marker="v",
+                   vmin=vmin, vmax=vmax, zorder=2)
+    if m <= label_limit:
+        for i in range(m):
+            text = f"{arr[i]}" if not hidden[i] else f"{arr[i]}\n+{hidden[i]}"
+            ax.annotate(text, (x[i], y[i]), ha="center", va="center", fontsize=8, zorder=3)
+    ax.set_xlim(-1.02, 1.02)
+    ax.set_ylim(y.min() - 0.5, 0.5)
+    return points
+
+def draw_heap_from_array(arr, title="Бінарна купа (піраміда)", engine="auto", max_depth=None):
     """
     Візуалізація бінарної купи, заданої масивом.
     Масив може бути мін-/макс-купою; функція просто відображає структуру.
+    engine: "networkx" — вузли Node і nx.draw, "batched" — draw_heap_batched,
+    "auto" — batched, починаючи з BATCHED_MIN_SIZE елементів або з max_depth.
     """
+    import matplotlib.pyplot as plt
+    if engine == "auto":
+        large = len(arr) >= BATCHED_MIN_SIZE or max_depth is not None
+        engine = "batched" if large and HAS_NUMPY else "networkx"
+    if engine == "batched":
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.set_title(title)
+        points = draw_heap_batched(ax, arr, max_depth=max_depth)
+        fig.colorbar(points, ax=ax, label=points.get_label())
+        ax.axis('off')
+        plt.tight_layout()
+        plt.show()
+        return
+    import networkx as nx
     root, nodes = array_to_heap_tree(arr)
     if root is None:
         raise ValueError("Порожній масив.")
@@ -60,6 +203,21 @@ def draw_heap_from_array(arr, title="Бінарна купа (піраміда)"
     plt.show()
 
 if __name__ == "__main__":
-    # Приклад: мін-купа
-    heap_array = [1, 3, 5, 7, 9, 11, 13, 15]
-    draw_heap_from_array(heap_array, title="Бінарна купа з масиву: " + str(heap_array))
+    parser = argparse.ArgumentParser(description="Візуалізація бінарної купи з масиву")
+    parser.add_argument("-n", "--size", type=int, default=None,
+                        help="Розмір випадкової мін-купи (без параметра — демо з 8 елементів)")
+    parser.add_argument("--max-depth", type=int, default=None, help="Згортати піддерева, глибші за цей рівень")
+    parser.add_argument("--engine", choices=["auto", "networkx", "batched"], default="auto",
+                        help="networkx — Node і nx.draw, batched — без вузлів (auto: batched з 256 елементів)")
+    parser.add_argument("--seed", type=int, default=0, help="Зерно для випадкової купи")
+    args = parser.parse_args()
+    if args.size is None:
+        # Приклад: мін-купа
+        heap_array = [1, 3, 5, 7, 9, 11, 13, 15]
+        title = "Бінарна купа з масиву: " + str(heap_array)
+    else:
+        rng = random.Random(args.seed)
+        heap_array = [rng.randrange(10 * args.size) for _ in range(args.size)]
+        heapq.heapify(heap_array)
+        title = f"Мін-купа з {args.size} елементів"
+    draw_heap_from_array(heap_array, title=title, engine=args.engine, max_depth=args.max_depth)
@@ -0,0 +1,133 @@
+"""
+Опційні лічильники й таймінги для гарячих шляхів алгоритмів.
+
+Поза блоком record() інструментовані функції лише раз на виклик
+перевіряють `recorder() is None`, тож вимкнене інструментування майже
+нічого не коштує. Усередині блоку кожен виклик додає свій час і лічильники:
+  - Graph.dijkstra — pushes, pops, stale_pops, relaxations (і decrease_keys
+    для черг з priority_queues); виводяться з кінцевого стану купи, dist і
+    visited, а push під record() обгортається лічильником викликів — поза
+    блоком цикл не веде жодних лічильників;
+  - SinglyLinkedList.insertion_sort / merge_sort — comparisons, key_calls
+    (key обгортається лічильником, тож час сортування під record() більший);
+  - dynamic_programming — cells (переглянуті клітинки), cell_updates
+    (покращення dp[b]); рахуються після циклу з таблиці take.
+
+    with record() as rec:
+        g.dijkstra("A")
+    print(rec.to_json())
+    rec.dump_stats("run.prof")   # python -m pstats run.prof
+
+callback(name, counters, elapsed) викликається після кожного виклику.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import json
+import marshal
+
+Callback = Callable[[str, Dict[str, int], float], None]
+
+_active: Optional["Recorder"] = None
+
+
+def recorder() -> Optional["Recorder"]:
+    """Активний Recorder або None, якщо інструментування вимкнене."""
+    return _active
+
+
+@dataclass
+class Recorder:
+    callback: Optional[Callback] = None
+    # назва функції -> {лічильник: сума за всі виклики}
+    counters: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # назва функції -> [к-ть викликів, сумарний час у секундах]
+    timings: Dict[str, list] = field(default_factory=dict)
+    # назва функції -> (файл, рядок, ім'я) для сумісності з pstats
+    _locations: Dict[str, Tuple[str, int, str]] = field(default_factory=dict, repr=False)
+
+    def add(self, func: Callable[..., Any], elapsed: float, **counts: int) -> None:
+        name = func.__qualname__
+        if name not in self.timings:
+            code = func.__code__
+            self._locations[name] = (code.co_filename, code.co_firstlineno, code.co_name)
+            self.timings[name] = [0, 0.0]
+            self.counters[name] = {}
+        timing = self.timings[name]
+        timing[0] += 1
+        timing[1] += elapsed
+        totals = self.counters[name]
+        for k, v in counts.items():
+            totals[k] = totals.get(k, 0) + v
+        if self.callback is not None:
+            self.callback(name, counts, elapsed)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: {"calls": calls, "seconds": seconds, **self.counters[name]}
+                for name, (calls, seconds) in self.timings.items()}
+
+    def to_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        text = json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Записує таймінги у форматі cProfile (marshal-словник pstats), тож файл
+        читається pstats.Stats(path) і зовнішніми переглядачами профілів.
+        Виклики інструментованих функцій не вкладені, тому tottime = cumtime.
+        """
+        stats = {self._locations[name]: (calls, calls, seconds, seconds, {})
+                 for name, (calls, seconds) in self.timings.items()}
+        with open(path, "wb") as f:
+            marshal.dump(stats, f)
+
+
+@contextmanager
+def record(callback: Optional[Callback] = None) -> Iterator[Recorder]:
+    """Вмикає інструментування на час блоку; вкладені блоки мають власний Recorder."""
+    global _active
+    previous, _active = _active, Recorder(callback)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+class _CountedKey:
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value: Any, counts: Dict[str, int]) -> None:
+        self.value = value
+        self.counts = counts
+
+    def __lt__(self, other: "_CountedKey") -> bool:
+        self.counts["comparisons"] += 1
+        return self.value < other.value
+
+    def __le__(self, other: "_CountedKey") -> bool:
+        self.counts["comparisons"] += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "_CountedKey") -> bool:
+        self.counts["comparisons"] += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "_CountedKey") -> bool:
+        self.counts["comparisons"] += 1
+        return self.value >= other.value
+
+
+def counting_key(key: Callable[[Any], Any]) -> Tuple[Callable[[Any], _CountedKey], Dict[str, int]]:
+    """Обгортка key, що рахує виклики key і порівняння отриманих ключів."""
+    counts = {"comparisons": 0, "key_calls": 0}
+
+    def wrapped(value: Any) -> _CountedKey:
+        counts["key_calls"] += 1
+        return _CountedKey(key(value), counts)
+
+    return wrapped, counts
@@ -0,0 +1,27 @@
+"""
+Лінивий імпорт NumPy для всіх модулів репозиторію.
+
+Сам імпорт numpy триває ~0.1–0.2 с, а більшості шляхів (жадібний алгоритм,
+чистий DP, Дейкстра на Graph, CLI з --json) він не потрібен. Тому модулі
+не імпортують numpy на верхньому рівні, а на початку функції, якій він
+потрібен, пишуть
+
+    np = import_numpy()
+    if np is None:
+        ...  # запасний шлях на чистому Python або ImportError
+
+HAS_NUMPY дозволяє обрати шлях (наприклад, межі для solve_meals), не
+імпортуючи сам модуль.
+"""
+
+import importlib.util
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def import_numpy():
+    """Модуль numpy (імпортується при першому виклику) або None, якщо його немає."""
+    if not HAS_NUMPY:
+        return None
+    import numpy
+    return numpy
@@ -4,16 +4,28 @@
 - reverse_in_place(): реверсування списку шляхом зміни посилань між вузлами
 - insertion_sort(): сортування вставками
 - merge_sorted_lists(): злиття двох ВЖЕ відсортованих списків в один відсортований
+- merge_k_sorted_lists() / iter_merge_sorted(): k-шляхове злиття будь-якої
+  кількості відсортованих списків чи ітераторів через купу, O(n log k)
+Список зберігає вказівник на хвіст і довжину: append і len() — O(1),
+побудова з iterable (extend / from_iterable) — один лінійний прохід.
+Вузли Node мають __slots__; PooledLinkedList — варіант без окремих об'єктів
+вузлів: значення й індекси next лежать у паралельних буферах array.
 Написано на Python 3.10+.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Iterable, Optional, Iterator, Callable, TypeVar
+from typing import Iterable, Optional, Iterator, Callable, TypeVar, Union
+from array import array
+import heapq
+import sys
+import time
+
+from instrumentation import counting_key, recorder
 
 T = TypeVar("T")
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     value: T
     next: Optional["Node"] = None
@@ -21,9 +33,24 @@ class Node:
 class SinglyLinkedList:
     def __init__(self, iterable: Optional[Iterable[T]] = None) -> None:
         self.head: Optional[Node] = None
+        self._tail: Optional[Node] = None
+        self._len = 0
         if iterable is not None:
-            for item in iterable:
-                self.append(item)
+            self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> "SinglyLinkedList":
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    def _detach(self) -> None:
+        """Робить список порожнім: його вузли забрав інший список."""
+        self.head = self._tail = None
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
 
     def __iter__(self) -> Iterator[T]:
         cur = self.head
@@ -34,13 +61,27 @@ class SinglyLinkedList:
     # Утиліти
     def append(self, value: T) -> None:
         node = Node(value)
-        if self.head is None:
+        if self._tail is None:
             self.head = node
-            return
-        cur = self.head
-        while cur.next:
-            cur = cur.next
-        cur.next = node
+        else:
+            self._tail.next = node
+        self._tail = node
+        self._len += 1
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """Дописує елементи в кінець, зв'язуючи вузли за один прохід."""
+        tail = self._tail
+        count = 0
+        for item in iterable:
+            node = Node(item)
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        self._tail = tail
+        self._len += count
 
     def to_list(self) -> list[T]:
         return list(iter(self))
@@ -54,67 +95,133 @@ class SinglyLinkedList:
             cur.next = prev
             prev = cur
             cur = nxt
+        self._tail = self.head
         self.head = prev
 
     # 2а) Сортування вставками (in-place, стабільне)
     def insertion_sort(self, key: Callable[[T], object] = lambda x: x) -> None:
+        rec = recorder()
+        if rec is not None:
+            key, counts = counting_key(key)
+            start = time.perf_counter()
         sorted_head: Optional[Node] = None
+        sorted_tail: Optional[Node] = None
 
         cur = self.head
         while cur:
             nxt = cur.next
+            k = key(cur.value)
             # Вставляємо cur в правильне місце у відсортованому підсписку
-            if sorted_head is None or key(cur.value) < key(sorted_head.value):
+            if sorted_head is None or k < key(sorted_head.value):
                 cur.next = sorted_head
                 sorted_head = cur
             else:
                 s = sorted_head
-                while s.next and key(s.next.value) <= key(cur.value):
+                while s.next and key(s.next.value) <= k:
                     s = s.next
                 cur.next = s.next
                 s.next = cur
+            if cur.next is None:
+                sorted_tail = cur
             cur = nxt
 
         self.head = sorted_head
+        self._tail = sorted_tail
+        if rec is not None:
+            rec.add(SinglyLinkedList.insertion_sort, time.perf_counter() - start, **counts)
 
     # 2б) Сортування злиттям (альтернатива до insertion_sort)
     def merge_sort(self, key: Callable[[T], object] = lambda x: x) -> None:
-        def split(head: Optional[Node]) -> tuple[Optional[Node], Optional[Node]]:
-            if head is None or head.next is None:
-                return head, None
-            slow = head
-            fast = head.next
-            while fast and fast.next:
-                slow = slow.next  # type: ignore
-                fast = fast.next.next
-            middle = slow.next  # type: ignore
-            slow.next = None  # type: ignore
-            return head, middle
-
-        def merge(a: Optional[Node], b: Optional[Node]) -> Optional[Node]:
-            dummy = Node(None)  # type: ignore
-            tail = dummy
-            while a and b:
-                if key(a.value) <= key(b.value):
-                    tail.next, a = a, a.next
-                else:
-                    tail.next, b = b, b.next
-                tail = tail.next
-            tail.next = a if a else b
-            return dummy.next
-
-        def sort(head: Optional[Node]) -> Optional[Node]:
-            if head is None or head.next is None:
-                return head
-            left, right = split(head)
-            return merge(sort(left), sort(right))
-
-        self.head = sort(self.head)
+        """
+        Природне висхідне (bottom-up) сортування злиттям без рекурсії:
+        список ділиться на вже впорядковані серії (строго спадні розвертаються),
+        після чого сусідні серії зливаються попарно, доки не лишиться одна.
+        key обчислюється рівно раз для кожного елемента; сортування стабільне,
+        а майже відсортований список обробляється майже за лінійний час.
+        """
+        rec = recorder()
+        if rec is not None:
+            key, counts = counting_key(key)
+            start = time.perf_counter()
+        runs = self._natural_runs(key)
+        while len(runs) > 1:
+            merged = [self._merge_runs(runs[i], runs[i + 1]) for i in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+        if runs:
+            self.head, self._tail, _ = runs[0]
+        if rec is not None:
+            rec.add(SinglyLinkedList.merge_sort, time.perf_counter() - start, **counts)
+
+    def _natural_runs(self, key: Callable[[T], object]) -> list[tuple[Node, Node, list]]:
+        """Розрізає список на серії (голова, хвіст, ключі серії)."""
+        runs = []
+        cur = self.head
+        k_cur = key(cur.value) if cur is not None else None
+        while cur is not None:
+            head = tail = cur
+            keys = [k_cur]
+            nxt = cur.next
+            k_nxt = key(nxt.value) if nxt is not None else None
+            if nxt is not None and k_nxt < k_cur:
+                # Строго спадна серія: розвертаємо її, стабільність не порушується
+                while nxt is not None and k_nxt < keys[-1]:
+                    keys.append(k_nxt)
+                    after = nxt.next
+                    nxt.next = head
+                    head = nxt
+                    nxt = after
+                    k_nxt = key(nxt.value) if nxt is not None else None
+                keys.reverse()
+            else:
+                while nxt is not None and not k_nxt < keys[-1]:
+                    keys.append(k_nxt)
+                    tail = nxt
+                    nxt = nxt.next
+                    k_nxt = key(nxt.value) if nxt is not None else None
+            tail.next = None
+            runs.append((head, tail, keys))
+            # Ключ першого вузла наступної серії вже обчислено
+            cur, k_cur = nxt, k_nxt
+        return runs
+
+    @staticmethod
+    def _merge_runs(a: tuple[Node, Node, list],
+                    b: tuple[Node, Node, list]) -> tuple[Node, Node, list]:
+        pa, tail_a, ka = a
+        pb, tail_b, kb = b
+        dummy = Node(None)  # type: ignore
+        tail = dummy
+        keys = []
+        i = j = 0
+        na, nb = len(ka), len(kb)
+        while i < na and j < nb:
+            if ka[i] <= kb[j]:
+                tail.next, pa = pa, pa.next
+                keys.append(ka[i])
+                i += 1
+            else:
+                tail.next, pb = pb, pb.next
+                keys.append(kb[j])
+                j += 1
+            tail = tail.next
+        if i < na:
+            tail.next = pa
+            keys.extend(ka[i:])
+            return dummy.next, tail_a, keys
+        tail.next = pb
+        keys.extend(kb[j:])
+        return dummy.next, tail_b, keys
 
     # 3) Злиття двох ВІДсортованих списків в новий відсортований
     @staticmethod
     def merge_sorted_lists(a: "SinglyLinkedList", b: "SinglyLinkedList",
                            key: Callable[[T], object] = lambda x: x) -> "SinglyLinkedList":
+        """
+        Перезв'язує вузли a і b в новий список без копіювання, тож злиття
+        споживає вхідні списки: після нього a і b порожні.
+        """
         pa, pb = a.head, b.head
         dummy = Node(None)  # type: ignore
         tail = dummy
@@ -128,9 +235,235 @@ class SinglyLinkedList:
 
         out = SinglyLinkedList()
         out.head = dummy.next
+        # Хвіст результату — хвіст того списку, що залишився, або останній злитий вузол
+        out._tail = a._tail if pa else b._tail if pb else (tail if out.head else None)
+        out._len = len(a) + len(b)
+        a._detach()
+        b._detach()
+        return out
+
+    # 3б) k-шляхове злиття будь-якої кількості відсортованих джерел
+    @staticmethod
+    def merge_k_sorted_lists(*sources: Union["SinglyLinkedList", Iterable[T]],
+                             key: Callable[[T], object] = lambda x: x) -> "SinglyLinkedList":
+        """
+        Зливає відсортовані SinglyLinkedList (їхні вузли перезв'язуються, як у
+        merge_sorted_lists, і після злиття ці списки порожні) та звичайні
+        ітерованні (для них створюються вузли).
+        Злиття стабільне: при рівних ключах першим іде елемент з раннішого джерела.
+        """
+        def nodes(src: Union["SinglyLinkedList", Iterable[T]]) -> Iterator[Node]:
+            if isinstance(src, SinglyLinkedList):
+                cur = src.head
+                while cur is not None:
+                    # next читаємо до yield: вузол буде перезв'язано в результаті
+                    nxt = cur.next
+                    yield cur
+                    cur = nxt
+            else:
+                for value in src:
+                    yield Node(value)
+
+        dummy = Node(None)  # type: ignore
+        tail = dummy
+        count = 0
+        for node in heapq.merge(*(nodes(s) for s in sources), key=lambda n: key(n.value)):
+            tail.next = node
+            tail = node
+            count += 1
+        tail.next = None
+        for src in sources:
+            if isinstance(src, SinglyLinkedList):
+                src._detach()
+
+        out = SinglyLinkedList()
+        out.head = dummy.next
+        out._tail = tail if count else None
+        out._len = count
         return out
 
 
+def iter_merge_sorted(*sources: Iterable[T],
+                      key: Callable[[T], object] = lambda x: x) -> Iterator[T]:
+    """
+    Лінивий стабільний k-шляховий злиток відсортованих джерел (списків,
+    генераторів, файлів): у пам'яті одночасно лише по одному елементу з кожного.
+    """
+    yield from heapq.merge(*sources, key=key)
+
+
+_MISSING = object()
+
+
+class PooledLinkedList:
+    """
+    Однозв'язний список у пулі: вузол — це індекс i, значення в values[i],
+    наступний вузол — nxt[i] (-1 — кінець списку). З typecode (наприклад "q"
+    або "d") значення теж зберігаються в array, без окремих Python-об'єктів.
+    Семантика reverse_in_place / сортувань / злиття та сама, що в SinglyLinkedList.
+    """
+    _END = -1
+
+    def __init__(self, iterable: Optional[Iterable[T]] = None,
+                 typecode: Optional[str] = None) -> None:
+        self.typecode = typecode
+        self.values: Union[list, array] = array(typecode) if typecode else []
+        self.nxt = array("q")
+        self.head = self._END
+        self._tail = self._END
+        if iterable is not None:
+            self.extend(iterable)
+
+    def _detach(self) -> None:
+        """Робить список порожнім і звільняє пул: його значення забрав інший список."""
+        self.values = array(self.typecode) if self.typecode else []
+        self.nxt = array("q")
+        self.head = self._tail = self._END
+
+    def __len__(self) -> int:
+        # Вузли ніколи не видаляються, тож розмір пулу дорівнює довжині списку
+        return len(self.nxt)
+
+    def __iter__(self) -> Iterator[T]:
+        values, nxt = self.values, self.nxt
+        cur = self.head
+        while cur != self._END:
+            yield values[cur]
+            cur = nxt[cur]
+
+    def append(self, value: T) -> None:
+        i = len(self.nxt)
+        self.values.append(value)
+        self.nxt.append(self._END)
+        if self._tail == self._END:
+            self.head = i
+        else:
+            self.nxt[self._tail] = i
+        self._tail = i
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        start = len(self.nxt)
+        self.values.extend(iterable)
+        end = len(self.values)
+        if end == start:
+            return
+        # Нові вузли йдуть у пулі підряд: i -> i + 1
+        self.nxt.extend(range(start + 1, end + 1))
+        self.nxt[end - 1] = self._END
+        if self._tail == self._END:
+            self.head = start
+        else:
+            self.nxt[self._tail] = start
+        self._tail = end - 1
+
+    def to_list(self) -> list[T]:
+        return list(iter(self))
+
+    def nbytes(self) -> int:
+        """Пам'ять буферів values і nxt (без самих об'єктів-значень у режимі list)."""
+        return sys.getsizeof(self.values) + sys.getsizeof(self.nxt)
+
+    def _relink(self, order: list[int]) -> None:
+        nxt = self.nxt
+        for a, b in zip(order, order[1:]):
+            nxt[a] = b
+        if order:
+            nxt[order[-1]] = self._END
+            self.head, self._tail = order[0], order[-1]
+        else:
+            self.head = self._tail = self._END
+
+    def _order(self) -> list[int]:
+        order = []
+        nxt, cur = self.nxt, self.head
+        while cur != self._END:
+            order.append(cur)
+            cur = nxt[cur]
+        return order
+
+    def reverse_in_place(self) -> None:
+        nxt = self.nxt
+        prev, cur = self._END, self.head
+        while cur != self._END:
+            nxt[cur], prev, cur = prev, cur, nxt[cur]
+        self.head, self._tail = prev, self.head
+
+    def insertion_sort(self, key: Callable[[T], object] = lambda x: x) -> None:
+        values, nxt, end = self.values, self.nxt, self._END
+        sorted_head = sorted_tail = end
+        cur = self.head
+        while cur != end:
+            after = nxt[cur]
+            k = key(values[cur])
+            if sorted_head == end or k < key(values[sorted_head]):
+                nxt[cur] = sorted_head
+                sorted_head = cur
+            else:
+                s = sorted_head
+                while nxt[s] != end and key(values[nxt[s]]) <= k:
+                    s = nxt[s]
+                nxt[cur] = nxt[s]
+                nxt[s] = cur
+            if nxt[cur] == end:
+                sorted_tail = cur
+            cur = after
+        self.head, self._tail = sorted_head, sorted_tail
+
+    def merge_sort(self, key: Callable[[T], object] = lambda x: x) -> None:
+        """Стабільне сортування: ключі обчислюються раз, вузли лише перезв'язуються."""
+        values = self.values
+        order = self._order()
+        keys = [key(values[i]) for i in order]
+        perm = sorted(range(len(order)), key=keys.__getitem__)
+        self._relink([order[p] for p in perm])
+
+    @staticmethod
+    def merge_sorted_lists(a: "PooledLinkedList", b: "PooledLinkedList",
+                           key: Callable[[T], object] = lambda x: x) -> "PooledLinkedList":
+        """
+        Новий список у власному пулі; при рівних ключах першими йдуть елементи a.
+        Як і SinglyLinkedList.merge_sorted_lists, злиття споживає вхідні списки:
+        значення переносяться в пул результату, а пули a і b звільняються.
+        """
+        out = PooledLinkedList(typecode=a.typecode if a.typecode == b.typecode else None)
+        ia, ib = iter(a), iter(b)
+        va = next(ia, _MISSING)
+        vb = next(ib, _MISSING)
+        while va is not _MISSING and vb is not _MISSING:
+            if key(va) <= key(vb):
+                out.append(va)
+                va = next(ia, _MISSING)
+            else:
+                out.append(vb)
+                vb = next(ib, _MISSING)
+        if va is not _MISSING:
+            out.append(va)
+            out.extend(ia)
+        if vb is not _MISSING:
+            out.append(vb)
+            out.extend(ib)
+        a._detach()
+        b._detach()
+        return out
+
+
+def bytes_per_element(lst: Union[SinglyLinkedList, PooledLinkedList]) -> float:
+    """
+    Накладні витрати пам'яті на елемент: розмір вузлів (SinglyLinkedList)
+    або буферів пулу (PooledLinkedList), без об'єктів-значень.
+    """
+    if not len(lst):
+        return 0.0
+    if isinstance(lst, PooledLinkedList):
+        return lst.nbytes() / len(lst)
+    total = 0
+    cur = lst.head
+    while cur:
+        total += sys.getsizeof(cur)
+        cur = cur.next
+    return total / len(lst)
+
+
 if __name__ == "__main__":
     # Демонстрація
     print("ДЕМОНСТРАЦІЯ ЗАВДАННЯ 1")
@@ -144,9 +477,20 @@ if __name__ == "__main__":
     a = SinglyLinkedList([1, 3, 5, 7])
     b = SinglyLinkedList([2, 4, 6, 8, 10])
     merged = SinglyLinkedList.merge_sorted_lists(a, b)
-    print("Злиття:", merged.to_list())
+    print("Злиття:", merged.to_list(), "| a і b після злиття:", a.to_list(), b.to_list())
 
     # Демонстрація merge_sort
     c = SinglyLinkedList([9, 2, 7, 1, 5, 3])
     c.merge_sort()
     print("Після merge_sort:", c.to_list())
+
+    big = SinglyLinkedList.from_iterable(range(100000))
+    big.append(-1)
+    print("Довжина великого списку:", len(big))
+
+    shards = [SinglyLinkedList(range(i, 30, 3)) for i in range(3)]
+    print("k-шляхове злиття:", SinglyLinkedList.merge_k_sorted_lists(*shards, iter([0, 15])).to_list())
+
+    pooled = PooledLinkedList(range(100000), typecode="q")
+    print(f"Пам'ять на елемент: вузли = {bytes_per_element(big):.1f} Б, "
+          f"пул = {bytes_per_element(pooled):.1f} Б")
@@ -1,6 +1,11 @@
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import bisect
+import time
+
+from instrumentation import recorder
+from lazy_numpy import HAS_NUMPY, import_numpy
 
 Item = Tuple[int, int]  # (cost, calories)
 
@@ -24,6 +29,9 @@ def dynamic_programming(items: Dict[str, Dict[str,int]], budget: int):
     0/1-рюкзак: кожну страву можна взяти або ні. Вартість — "вага", калорії — "цінність".
     DP по цілих бюджетах від 0..budget. Також відновлюємо оптимальний набір.
     """
+    rec = recorder()
+    if rec is not None:
+        start = time.perf_counter()
     names = list(items.keys())
     costs = [items[n]["cost"] for n in names]
     cals  = [items[n]["calories"] for n in names]
@@ -47,8 +55,307 @@ def dynamic_programming(items: Dict[str, Dict[str,int]], budget: int):
             total_cost += costs[i]
             b -= costs[i]
     res.reverse()
+    if rec is not None:
+        # Кожне покращення dp[b] позначене в take — рахуємо після циклу, а не в ньому
+        rec.add(dynamic_programming, time.perf_counter() - start,
+                cells=sum(budget - c + 1 for c in costs if c <= budget),
+                cell_updates=sum(map(sum, take)))
     return res, total_cost, dp[budget]
 
+def dynamic_programming_numpy(items: Dict[str, Dict[str,int]], budget: int):
+    """
+    Той самий 0/1-рюкзак, що й dynamic_programming, але рядок кожної страви
+    оновлюється одним векторним np.maximum над зсунутим масивом dp, а рішення
+    "брати/не брати" зберігаються як упаковані бітові рядки (1 біт замість
+    Python-bool). Повертає такий самий кортеж (назви, вартість, калорії).
+    """
+    np = import_numpy()
+    if np is None:
+        raise ImportError("dynamic_programming_numpy потребує NumPy: pip install numpy")
+    names = list(items.keys())
+    costs = [items[n]["cost"] for n in names]
+    cals  = [items[n]["calories"] for n in names]
+    n = len(names)
+    dp = np.zeros(budget+1, dtype=np.int64)
+    # take[i] — упакований біт-рядок довжини budget+1 (порядок бітів як у np.packbits)
+    take = np.zeros((n, (budget+8) // 8), dtype=np.uint8)
+    row = np.zeros(budget+1, dtype=bool)
+    for i in range(n):
+        cost, cal = costs[i], cals[i]
+        if cost > budget:
+            continue
+        # cand[b-cost] = dp[b-cost] + cal обчислено зі СТАРОГО dp, тому 0/1, а не unbounded
+        cand = dp[:budget+1-cost] + cal
+        better = cand > dp[cost:]
+        row[:cost] = False
+        row[cost:] = better
+        take[i] = np.packbits(row)
+        np.maximum(dp[cost:], cand, out=dp[cost:])
+    # Відновлення набору
+    res, b, total_cost = [], budget, 0
+    for i in range(n-1, -1, -1):
+        if (take[i, b >> 3] >> (7 - (b & 7))) & 1:
+            res.append(names[i])
+            total_cost += costs[i]
+            b -= costs[i]
+    res.reverse()
+    return res, total_cost, int(dp[budget])
+
+def _knapsack_step(prev, cost: int, cal: int):
+    """
+    Наступний рядок 0/1-рюкзака з попереднього (NumPy-масив або список) і
+    біти "страву взято": упакований np.packbits-рядок або ціле число-маска.
+    """
+    size = len(prev)
+    if not isinstance(prev, list):
+        np = import_numpy()
+        row = prev.copy()
+        taken = np.zeros(size, dtype=bool)
+        if cost < size:
+            cand = prev[:size-cost] + cal
+            taken[cost:] = cand > prev[cost:]
+            np.maximum(prev[cost:], cand, out=row[cost:])
+        return row, np.packbits(taken)
+    row, mask = prev[:cost], 0
+    for b in range(cost, size):
+        cand = prev[b-cost] + cal
+        if cand > prev[b]:
+            row.append(cand)
+            mask |= 1 << b
+        else:
+            row.append(prev[b])
+    return row, mask
+
+def _is_taken(taken, b: int) -> bool:
+    if isinstance(taken, int):
+        return bool((taken >> b) & 1)
+    return bool((taken[b >> 3] >> (7 - (b & 7))) & 1)
+
+# KnapsackSolver зберігає повний рядок dp після кожних CHECKPOINT_EVERY страв
+CHECKPOINT_EVERY = 32
+
+class KnapsackSolver:
+    """
+    Один прохід DP для всіх бюджетів 0..max_budget: для кожної страви
+    зберігаються лише біти "взято" (1 біт на бюджет), плюс останній рядок dp
+    і повні рядки-контрольні точки через кожні CHECKPOINT_EVERY страв.
+    Відповідь для будь-якого бюджету — відновлення набору за бітами, O(n).
+    Додавання страви — один новий рядок, O(W), де W = max_budget+1.
+    Видалення k-ї з n страв відкидає біти від найближчої контрольної точки
+    і перераховує їх ліниво, при наступному запиті: O((n−k)·W) плюс до
+    CHECKPOINT_EVERY рядків; кілька видалень поспіль перераховуються разом.
+    Пам'ять — n·W біт і (n/CHECKPOINT_EVERY + 1) рядків по W чисел.
+    """
+    def __init__(self, items: Dict[str, Dict[str,int]], max_budget: int):
+        self.max_budget = max_budget
+        self.names: List[str] = []
+        self.costs: List[int] = []
+        self.cals: List[int] = []
+        np = import_numpy()
+        zero = np.zeros(max_budget+1, dtype=np.int64) if np is not None else [0]*(max_budget+1)
+        # _checkpoints[j] — рядок dp після перших j*CHECKPOINT_EVERY страв
+        self._checkpoints = [zero]
+        # _taken[i] — біти i-ї страви; актуальні лише для перших len(_taken) страв
+        self._taken: list = []
+        self._row = zero
+        for name, data in items.items():
+            self.add_item(name, data["cost"], data["calories"])
+
+    def _extend(self) -> None:
+        """Дораховує біти і рядок для страв, яких ще немає в _taken."""
+        for i in range(len(self._taken), len(self.names)):
+            self._row, taken = _knapsack_step(self._row, self.costs[i], self.cals[i])
+            self._taken.append(taken)
+            if (i + 1) % CHECKPOINT_EVERY == 0:
+                self._checkpoints.append(self._row)
+
+    def add_item(self, name: str, cost: int, calories: int) -> None:
+        if name in self.names:
+            raise ValueError(f"Страва {name!r} вже є в меню.")
+        self.names.append(name)
+        self.costs.append(cost)
+        self.cals.append(calories)
+        if len(self._taken) == len(self.names) - 1:
+            self._extend()
+
+    def remove_item(self, name: str) -> None:
+        i = self.names.index(name)
+        del self.names[i], self.costs[i], self.cals[i]
+        # Префікс до найближчої контрольної точки не залежить від видаленої страви
+        j = min(i // CHECKPOINT_EVERY, len(self._checkpoints) - 1)
+        del self._checkpoints[j+1:]
+        del self._taken[j*CHECKPOINT_EVERY:]
+        self._row = self._checkpoints[j]
+
+    def _check(self, budget: int) -> None:
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(f"Бюджет має бути в межах 0..{self.max_budget}.")
+        self._extend()
+
+    def best_calories(self, budget: int) -> int:
+        self._check(budget)
+        return int(self._row[budget])
+
+    def solve(self, budget: int) -> Tuple[List[str], int, int]:
+        """Те саме, що dynamic_programming(items, budget), без повторного DP."""
+        self._check(budget)
+        res, b, total_cost = [], budget, 0
+        for i in range(len(self.names)-1, -1, -1):
+            # Страву взято, якщо вона строго покращила рядок на цьому бюджеті
+            if _is_taken(self._taken[i], b):
+                res.append(self.names[i])
+                total_cost += self.costs[i]
+                b -= self.costs[i]
+        res.reverse()
+        return res, total_cost, int(self._row[budget])
+
+def _feasible(items: Dict[str, Dict[str,int]], budget: int):
+    """Страви, що поміщаються в бюджет: список (назва, вартість, калорії) у порядку items."""
+    return [(name, d["cost"], d["calories"]) for name, d in items.items() if d["cost"] <= budget]
+
+def branch_and_bound(items: Dict[str, Dict[str,int]], budget: int) -> Tuple[List[str], int, int]:
+    """
+    Точний 0/1-рюкзак методом гілок і меж, не залежний від розміру budget.
+    Страви впорядковано за calories/cost (як у greedy_algorithm), а верхня
+    межа гілки — дробова жадібна релаксація, яка рахується за O(log n)
+    бінарним пошуком по префіксних сумах. Обхід у глибину без рекурсії.
+    На сильно корельованих даних (calories ≈ cost + c) межа майже не
+    відсікає, і кількість вузлів росте експоненційно від n.
+    """
+    return _branch_and_bound(items, budget, None)
+
+def _branch_and_bound(items: Dict[str, Dict[str,int]], budget: int,
+                      max_nodes: Optional[int]) -> Optional[Tuple[List[str], int, int]]:
+    """branch_and_bound, що повертає None, коли обійдено більше max_nodes вузлів."""
+    feasible = _feasible(items, budget)
+    # Безкоштовні страви з калоріями беремо завжди, решту сортуємо за співвідношенням
+    free = [f for f in feasible if f[1] == 0 and f[2] > 0]
+    rest = sorted((f for f in feasible if f[1] > 0 and f[2] > 0),
+                  key=lambda f: f[2] / f[1], reverse=True)
+    costs = [f[1] for f in rest]
+    cals = [f[2] for f in rest]
+    n = len(rest)
+    pre_cost, pre_cal = [0], [0]
+    for c, v in zip(costs, cals):
+        pre_cost.append(pre_cost[-1] + c)
+        pre_cal.append(pre_cal[-1] + v)
+
+    def bound(i: int, cap: int, val: int) -> float:
+        # k — скільки страв з i-ї поміщаються цілком; далі частка наступної
+        k = bisect.bisect_right(pre_cost, pre_cost[i] + cap, i) - 1
+        val += pre_cal[k] - pre_cal[i]
+        if k < n:
+            val += cals[k] * (cap - (pre_cost[k] - pre_cost[i])) / costs[k]
+        return val
+
+    best_val, best_set = -1, None
+    # Вузол: (індекс наступної страви, залишок бюджету, калорії, вибір як зв'язаний кортеж)
+    stack = [(0, budget, 0, None)]
+    nodes = 0
+    while stack:
+        i, cap, val, chosen = stack.pop()
+        nodes += 1
+        if max_nodes is not None and nodes > max_nodes:
+            return None
+        if val > best_val:
+            best_val, best_set = val, chosen
+        if i == n or int(bound(i, cap, val)) <= best_val:
+            continue
+        stack.append((i + 1, cap, val, chosen))
+        if costs[i] <= cap:
+            # Гілку "взяти" кладемо останньою — вона розглядається першою
+            stack.append((i + 1, cap - costs[i], val + cals[i], (i, chosen)))
+
+    picked = set()
+    while best_set is not None:
+        picked.add(rest[best_set[0]][0])
+        best_set = best_set[1]
+    picked.update(f[0] for f in free)
+    res = [name for name in items if name in picked]
+    total_cost = sum(items[name]["cost"] for name in res)
+    total_cal = sum(items[name]["calories"] for name in res)
+    return res, total_cost, total_cal
+
+def fptas(items: Dict[str, Dict[str,int]], budget: int, eps: float = 0.1) -> Tuple[List[str], int, int]:
+    """
+    Наближений 0/1-рюкзак (FPTAS): калорії масштабуються на K = eps * max_cal / n,
+    і DP рахує мінімальну вартість для кожної масштабованої суми калорій.
+    Гарантія: калорії результату >= (1 - eps) * оптимум; час O(n^3 / eps)
+    не залежить від budget.
+    """
+    if not 0 < eps < 1:
+        raise ValueError("eps має бути в інтервалі (0, 1).")
+    feasible = [f for f in _feasible(items, budget) if f[2] > 0]
+    if not feasible:
+        return [], 0, 0
+    n = len(feasible)
+    k = eps * max(f[2] for f in feasible) / n
+    scaled = [int(f[2] // k) for f in feasible]
+    top = sum(scaled)
+    inf = budget + 1
+    # min_cost[v] — мінімальна вартість набору з масштабованими калоріями рівно v
+    np = import_numpy()
+    if np is not None:
+        min_cost = np.full(top + 1, inf, dtype=np.int64)
+    else:
+        min_cost = [inf] * (top + 1)
+    min_cost[0] = 0
+    # take[i] — упакований біт-рядок (порядок бітів як у np.packbits)
+    take = []
+    mask = np.zeros(top + 1, dtype=bool) if np is not None else None
+    for (_, cost, _), v in zip(feasible, scaled):
+        if np is not None:
+            cand = min_cost[:top + 1 - v] + cost
+            mask[:v] = False
+            mask[v:] = cand < min_cost[v:]
+            take.append(np.packbits(mask))
+            np.minimum(min_cost[v:], cand, out=min_cost[v:])
+        else:
+            row = bytearray((top + 8) // 8)
+            for s in range(top, v - 1, -1):
+                if min_cost[s - v] + cost < min_cost[s]:
+                    min_cost[s] = min_cost[s - v] + cost
+                    row[s >> 3] |= 0x80 >> (s & 7)
+            take.append(row)
+    s = top
+    while min_cost[s] > budget:
+        s -= 1
+    picked = set()
+    for i in range(n - 1, -1, -1):
+        if (take[i][s >> 3] >> (7 - (s & 7))) & 1:
+            picked.add(feasible[i][0])
+            s -= scaled[i]
+    res = [name for name in items if name in picked]
+    total_cost = sum(items[name]["cost"] for name in res)
+    total_cal = sum(items[name]["calories"] for name in res)
+    return res, total_cost, total_cal
+
+# Межі для solve_meals: кількість клітинок таблиці DP, страв і вузлів для гілок і меж
+DP_MAX_CELLS = 50_000_000 if HAS_NUMPY else 5_000_000
+BB_MAX_ITEMS = 200
+# ~0.2–0.3 с обходу (близько 10^6 вузлів за секунду); далі — FPTAS
+BB_MAX_NODES = 200_000
+# Менші таблиці чистий DP рахує швидше, ніж триває сам імпорт NumPy
+NUMPY_MIN_CELLS = 200_000
+
+def solve_meals(items: Dict[str, Dict[str,int]], budget: int, eps: float = 0.01) -> Tuple[List[str], int, int]:
+    """
+    Обирає розв'язувач за розміром задачі: DP, якщо таблиця n x (budget+1)
+    невелика; інакше гілки і межі для помірної кількості страв, поки обхід
+    не перевищить BB_MAX_NODES вузлів; інакше FPTAS з eps.
+    """
+    n = len(items)
+    cells = n * (budget + 1)
+    if cells <= DP_MAX_CELLS:
+        if HAS_NUMPY and cells >= NUMPY_MIN_CELLS:
+            return dynamic_programming_numpy(items, budget)
+        return dynamic_programming(items, budget)
+    if n <= BB_MAX_ITEMS:
+        res = _branch_and_bound(items, budget, BB_MAX_NODES)
+        if res is not None:
+            return res
+    return fptas(items, budget, eps)
+
 if __name__ == "__main__":
     items = {
       "pizza": {"cost": 50, "calories": 300},
@@ -64,3 +371,15 @@ if __name__ == "__main__":
     print("Бюджет:", budget)
     print("Жадібний:", g_pick, "вартість =", g_cost, "калорії =", g_cal)
     print("Динамічне:", d_pick, "вартість =", d_cost, "калорії =", d_cal)
+    if HAS_NUMPY:
+        v_pick, v_cost, v_cal = dynamic_programming_numpy(items, budget)
+        print("Динамічне (NumPy):", v_pick, "вартість =", v_cost, "калорії =", v_cal)
+
+    solver = KnapsackSolver(items, max_budget=200)
+    for b in (50, 100, 150):
+        print(f"Бюджет {b}: калорії = {solver.best_calories(b)}, набір = {solver.solve(b)[0]}")
+    solver.remove_item("pizza")
+    print("Без pizza, бюджет 100:", solver.solve(100))
+
+    print("Гілки і межі:", branch_and_bound(items, budget))
+    print("FPTAS (eps=0.1):", fptas(items, budget, eps=0.1))
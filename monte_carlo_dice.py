@@ -2,7 +2,13 @@
 import random
 import math
 import argparse
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
+from statistics import NormalDist
+
+from lazy_numpy import import_numpy
+
+# Кидків в одному шматку: пам'ять обмежена розміром шматка, а не n_rolls
+CHUNK_SIZE = 1 << 22
 
 def simulate_two_dice(n_rolls: int):
     counts = {s: 0 for s in range(2, 13)}
@@ -12,12 +18,218 @@ def simulate_two_dice(n_rolls: int):
     probs = {s: counts[s]/n_rolls for s in counts}
     return counts, probs
 
-def analytical_probs():
-    ways = {2:1,3:2,4:3,5:4,6:5,7:6,8:5,9:4,10:3,11:2,12:1}
-    total = 36
-    return {s: ways[s]/total for s in ways}
+def _count_chunk(task):
+    """Лічильники 36 рівноймовірних результатів (a-1)*6 + (b-1) для одного шматка."""
+    seed_seq, size = task
+    np = import_numpy()
+    rng = np.random.default_rng(seed_seq)
+    outcomes = rng.integers(0, 36, size=size, dtype=np.uint8)
+    return np.bincount(outcomes, minlength=36)
+
+def simulate_two_dice_numpy(n_rolls: int, seed=None, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    """
+    Векторна симуляція: кидки генеруються шматками по chunk_size і рахуються
+    через np.bincount. Кожен шматок має власний потік SeedSequence(seed).spawn,
+    тож за однакового seed результат не залежить від кількості workers.
+    Повертає (counts, probs) у тому ж вигляді, що й simulate_two_dice.
+    """
+    np = import_numpy()
+    if np is None:
+        raise ImportError("simulate_two_dice_numpy потребує NumPy: pip install numpy")
+    n_chunks = -(-n_rolls // chunk_size)
+    children = np.random.SeedSequence(seed).spawn(n_chunks)
+    sizes = [chunk_size] * n_chunks
+    if n_chunks:
+        sizes[-1] = n_rolls - chunk_size * (n_chunks - 1)
+    tasks = list(zip(children, sizes))
+    if workers > 1 and n_chunks > 1:
+        # Пул процесів (і весь multiprocessing) потрібен лише тут
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_count_chunk, tasks)
+            by_outcome = sum(parts, np.zeros(36, dtype=np.int64))
+    else:
+        by_outcome = sum(map(_count_chunk, tasks), np.zeros(36, dtype=np.int64))
+    counts = {s: 0 for s in range(2, 13)}
+    for outcome, c in enumerate(by_outcome.tolist()):
+        counts[outcome // 6 + outcome % 6 + 2] += c
+    probs = {s: counts[s]/n_rolls for s in counts}
+    return counts, probs
+
+def analytical_probs(n_dice: int = 2, faces: int = 6, weights=None):
+    """
+    Точний розподіл суми n_dice кубиків з гранями 1..faces. Для однакових
+    граней кількість способів рахується цілочисельно (як 6/36 для суми 7),
+    для зважених граней або величезних випадків — dice_distribution.
+    """
+    if n_dice < 1 or faces < 1:
+        raise ValueError("Потрібен хоча б один кубик з хоча б однією гранню.")
+    if weights is None and faces ** n_dice < 2 ** 53:
+        ways = [1]
+        for _ in range(n_dice):
+            ways = _add_uniform_die(ways, faces)
+        total = faces ** n_dice
+        return {n_dice + i: w/total for i, w in enumerate(ways)}
+    return dice_distribution(n_dice, faces, weights)
+
+def _add_uniform_die(ways, faces):
+    """
+    Згортка з [1]*faces як ковзна сума вікна довжини faces: O(len) замість
+    O(len*faces), тож analytical_probs(2, 3000) — мілісекунди.
+    """
+    out, window = [], 0
+    for k in range(len(ways) + faces - 1):
+        if k < len(ways):
+            window += ways[k]
+        if k >= faces:
+            window -= ways[k - faces]
+        out.append(window)
+    return out
+
+def _convolve_ints(a, b):
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            out[i+j] += x*y
+    return out
+
+def _face_probs(faces, weights):
+    if weights is None:
+        return [1/faces] * faces
+    if len(weights) != faces or min(weights) < 0 or sum(weights) <= 0:
+        raise ValueError("weights: faces невід'ємних ваг з додатною сумою.")
+    total = sum(weights)
+    return [w/total for w in weights]
+
+# Починаючи з такої довжини результату, згортка рахується через FFT
+FFT_MIN_SIZE = 512
+
+def dice_distribution(n_dice: int, faces: int = 6, weights=None, method: str = "auto"):
+    """
+    Розподіл суми n_dice незалежних кубиків (можливо, зважених) як n-кратна
+    згортка розподілу однієї грані. method="direct" — піднесення до степеня
+    повторним піднесенням до квадрату з np.convolve, "fft" — один rfft,
+    піднесення спектра до степеня n і irfft (100d20 — мілісекунди).
+    Повертає {сума: ймовірність} для сум n_dice..n_dice*faces.
+    """
+    if n_dice < 1 or faces < 1:
+        raise ValueError("Потрібен хоча б один кубик з хоча б однією гранню.")
+    p = _face_probs(faces, weights)
+    size = n_dice * (faces - 1) + 1
+    if method == "auto":
+        method = "fft" if size >= FFT_MIN_SIZE else "direct"
+    np = import_numpy()
+    if np is None:
+        dist = [1.0]
+        for _ in range(n_dice):
+            dist = _convolve_ints(dist, p)
+    elif method == "fft":
+        spectrum = np.fft.rfft(p, size) ** n_dice
+        # Похибка FFT ~1e-16: від'ємні "нулі" в хвостах відсікаємо
+        dist = np.clip(np.fft.irfft(spectrum, size), 0.0, None).tolist()
+    elif method == "direct":
+        base, dist, k = np.asarray(p), np.ones(1), n_dice
+        while k:
+            if k & 1:
+                dist = np.convolve(dist, base)
+            k >>= 1
+            if k:
+                base = np.convolve(base, base)
+        dist = dist.tolist()
+    else:
+        raise ValueError(f"Невідомий метод {method!r}: auto, direct або fft.")
+    return {n_dice + i: pr for i, pr in enumerate(dist)}
+
+def _count_sums_chunk(task):
+    seed_seq, size, n_dice, p = task
+    np = import_numpy()
+    rng = np.random.default_rng(seed_seq)
+    faces = len(p)
+    if len(set(p)) == 1:
+        draws = rng.integers(0, faces, size=(size, n_dice), dtype=np.int16)
+    else:
+        draws = rng.choice(faces, size=(size, n_dice), p=p).astype(np.int32)
+    return np.bincount(draws.sum(axis=1, dtype=np.int64), minlength=n_dice*(faces-1)+1)
+
+def simulate_dice(n_rolls: int, n_dice: int = 2, faces: int = 6, weights=None, seed=None,
+                  chunk_size: int = CHUNK_SIZE):
+    """
+    Векторна симуляція сум n_dice кубиків для перевірки dice_distribution.
+    Шматки по ~chunk_size чисел, кожен зі своїм потоком SeedSequence(seed).spawn.
+    Повертає (counts, probs), ключі — суми n_dice..n_dice*faces.
+    """
+    np = import_numpy()
+    if np is None:
+        raise ImportError("simulate_dice потребує NumPy: pip install numpy")
+    p = _face_probs(faces, weights)
+    rows = max(1, chunk_size // n_dice)
+    n_chunks = -(-n_rolls // rows)
+    children = np.random.SeedSequence(seed).spawn(n_chunks)
+    total = np.zeros(n_dice*(faces-1)+1, dtype=np.int64)
+    for j, child in enumerate(children):
+        size = rows if j < n_chunks - 1 else n_rolls - rows * (n_chunks - 1)
+        total += _count_sums_chunk((child, size, n_dice, p))
+    counts = {n_dice + i: c for i, c in enumerate(total.tolist())}
+    probs = {s: counts[s]/n_rolls for s in counts}
+    return counts, probs
+
+@dataclass
+class Estimate:
+    n_rolls: int
+    counts: dict
+    probs: dict
+    half_width: float  # найбільша півширина довірчого інтервалу серед сум
+    chi2: float        # статистика хі-квадрат Пірсона відносно analytical_probs
+
+def _estimate(counts, n_rolls, z, ana):
+    probs = {s: counts[s]/n_rolls for s in counts}
+    # Інтервал Вілсона: не вироджується в нуль для рідкісних сум на малих n
+    half = 0.0
+    for p in probs.values():
+        h = z / (1 + z*z/n_rolls) * math.sqrt(p*(1-p)/n_rolls + z*z/(4*n_rolls*n_rolls))
+        half = max(half, h)
+    chi2 = sum((counts[s] - n_rolls*ana[s])**2 / (n_rolls*ana[s]) for s in counts)
+    return Estimate(n_rolls, dict(counts), probs, half, chi2)
+
+def stream_two_dice(batch_size: int = 100000, seed=None, confidence: float = 0.95, max_rolls=None):
+    """
+    Генератор проміжних оцінок: після кожної партії з batch_size кидків
+    повертає Estimate з накопиченими лічильниками, довірчими інтервалами та
+    відстанню хі-квадрат до аналітичного розподілу. Без max_rolls — нескінченний.
+    """
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    ana = analytical_probs()
+    counts = {s: 0 for s in range(2, 13)}
+    n = 0
+    np = import_numpy()
+    seed_seq = np.random.SeedSequence(seed) if np is not None else None
+    rng = random.Random(seed)
+    while max_rolls is None or n < max_rolls:
+        size = batch_size if max_rolls is None else min(batch_size, max_rolls - n)
+        if np is not None:
+            by_outcome = _count_chunk((seed_seq.spawn(1)[0], size))
+            for outcome, c in enumerate(by_outcome.tolist()):
+                counts[outcome // 6 + outcome % 6 + 2] += c
+        else:
+            for _ in range(size):
+                counts[rng.randint(1,6) + rng.randint(1,6)] += 1
+        n += size
+        yield _estimate(counts, n, z, ana)
+
+def simulate_until(target_error: float, confidence: float = 0.95, batch_size: int = 100000,
+                   seed=None, max_rolls: int = 10**9):
+    """
+    Кидає партіями, доки півширина довірчого інтервалу кожної суми не стане
+    <= target_error (або не вичерпається max_rolls). Повертає останню Estimate.
+    """
+    est = None
+    for est in stream_two_dice(batch_size, seed, confidence, max_rolls):
+        if est.half_width <= target_error:
+            break
+    return est
 
 def plot_probs(sim_probs, ana_probs):
+    import matplotlib.pyplot as plt
     sums = list(range(2,13))
     sim = [sim_probs[s] for s in sums]
     ana = [ana_probs[s] for s in sums]
@@ -38,8 +250,20 @@ def plot_probs(sim_probs, ana_probs):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Монте-Карло для двох кубиків")
     parser.add_argument("-n", "--n_rolls", type=int, default=100000, help="К-ть кидків")
+    parser.add_argument("--engine", choices=["python", "numpy"], default="python", help="Рушій симуляції")
+    parser.add_argument("--seed", type=int, default=None, help="Зерно генератора (numpy)")
+    parser.add_argument("--workers", type=int, default=1, help="К-ть процесів (numpy)")
+    parser.add_argument("--target-error", type=float, default=None,
+                        help="Кидати, доки півширина 95%% довірчого інтервалу не стане меншою (замість -n)")
     args = parser.parse_args()
-    counts, sim_probs = simulate_two_dice(args.n_rolls)
+    if args.target_error is not None:
+        est = simulate_until(args.target_error, seed=args.seed)
+        args.n_rolls, counts, sim_probs = est.n_rolls, est.counts, est.probs
+        print(f"Досягнуто півширини {est.half_width:.5f}, хі-квадрат = {est.chi2:.2f}")
+    elif args.engine == "numpy":
+        counts, sim_probs = simulate_two_dice_numpy(args.n_rolls, seed=args.seed, workers=args.workers)
+    else:
+        counts, sim_probs = simulate_two_dice(args.n_rolls)
     ana = analytical_probs()
     print("Кидків:", args.n_rolls)
     for s in range(2,13):
@@ -0,0 +1,298 @@
+"""
+Черги з пріоритетом для алгоритму Дейкстри (dijkstra_heap.Graph.dijkstra).
+
+Усі черги мають спільний інтерфейс:
+  - push(item, key) — вставити item або зменшити його ключ (більший ключ ігнорується);
+  - pop() -> (key, item) — вийняти елемент з мінімальним ключем;
+  - len(queue) — кількість елементів у черзі.
+
+Реалізації:
+  - LazyHeap — heapq з "лінивим" видаленням (застарілі записи лишаються в купі).
+  - IndexedBinaryHeap — бінарна купа з індексом позицій і справжнім decrease-key.
+  - PairingHeap — парна купа: O(1) вставка та decrease-key (амортизовано).
+  - BucketQueue — черга Діала: C+1 циклічних кошиків для цілих ваг 0..C.
+  - RadixHeap — radix-купа для монотонних цілих ключів.
+
+BucketQueue і RadixHeap вимагають цілих невід'ємних ваг і монотонності
+(новий ключ не менший за останній вийнятий) — саме так поводиться Дейкстра.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import heapq
+
+# Максимальна вага ребра, за якої make_queue("auto") обирає чергу Діала
+DIAL_MAX_WEIGHT = 1024
+
+
+class LazyHeap:
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, Any]] = []
+        self._key: Dict[Any, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._key)
+
+    def push(self, item: Any, key: float) -> None:
+        old = self._key.get(item)
+        if old is not None and key >= old:
+            return
+        self._key[item] = key
+        heapq.heappush(self._heap, (key, item))
+
+    def pop(self) -> Tuple[float, Any]:
+        while True:
+            key, item = heapq.heappop(self._heap)
+            # Застарілий запис: ключ елемента вже зменшили або його вийняли
+            if self._key.get(item) == key:
+                del self._key[item]
+                return key, item
+
+
+class IndexedBinaryHeap:
+    def __init__(self) -> None:
+        self._keys: List[float] = []
+        self._items: List[Any] = []
+        self._pos: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def push(self, item: Any, key: float) -> None:
+        i = self._pos.get(item)
+        if i is None:
+            i = len(self._items)
+            self._keys.append(key)
+            self._items.append(item)
+            self._pos[item] = i
+        elif key < self._keys[i]:
+            self._keys[i] = key
+        else:
+            return
+        self._sift_up(i)
+
+    def pop(self) -> Tuple[float, Any]:
+        keys, items = self._keys, self._items
+        key, item = keys[0], items[0]
+        del self._pos[item]
+        last_key, last_item = keys.pop(), items.pop()
+        if items:
+            keys[0], items[0] = last_key, last_item
+            self._pos[last_item] = 0
+            self._sift_down(0)
+        return key, item
+
+    def _sift_up(self, i: int) -> None:
+        keys, items, pos = self._keys, self._items, self._pos
+        key, item = keys[i], items[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if keys[parent] <= key:
+                break
+            keys[i], items[i] = keys[parent], items[parent]
+            pos[items[i]] = i
+            i = parent
+        keys[i], items[i] = key, item
+        pos[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        keys, items, pos = self._keys, self._items, self._pos
+        n = len(keys)
+        key, item = keys[i], items[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if keys[child] >= key:
+                break
+            keys[i], items[i] = keys[child], items[child]
+            pos[items[i]] = i
+            i = child
+        keys[i], items[i] = key, item
+        pos[item] = i
+
+
+class _PairingNode:
+    __slots__ = ("key", "item", "child", "sibling", "prev")
+
+    def __init__(self, key: float, item: Any) -> None:
+        self.key = key
+        self.item = item
+        self.child: Optional[_PairingNode] = None
+        self.sibling: Optional[_PairingNode] = None
+        # Батько для найлівішої дитини, інакше лівий брат
+        self.prev: Optional[_PairingNode] = None
+
+
+def _meld(a: _PairingNode, b: _PairingNode) -> _PairingNode:
+    if b.key < a.key:
+        a, b = b, a
+    b.prev = a
+    b.sibling = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    return a
+
+
+class PairingHeap:
+    def __init__(self) -> None:
+        self._root: Optional[_PairingNode] = None
+        self._nodes: Dict[Any, _PairingNode] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def push(self, item: Any, key: float) -> None:
+        node = self._nodes.get(item)
+        if node is None:
+            node = self._nodes[item] = _PairingNode(key, item)
+            self._root = node if self._root is None else _meld(self._root, node)
+            return
+        if key >= node.key:
+            return
+        node.key = key
+        if node is self._root:
+            return
+        # Вирізаємо піддерево вузла і зливаємо його з коренем
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+        self._root = _meld(self._root, node)
+
+    def pop(self) -> Tuple[float, Any]:
+        root = self._root
+        if root is None:
+            raise IndexError("pop from empty PairingHeap")
+        del self._nodes[root.item]
+        # Двопрохідне злиття дітей: попарно зліва направо, потім справа наліво
+        pairs: List[_PairingNode] = []
+        cur = root.child
+        while cur is not None:
+            a, cur = cur, cur.sibling
+            a.prev = a.sibling = None
+            if cur is not None:
+                b, cur = cur, cur.sibling
+                b.prev = b.sibling = None
+                a = _meld(a, b)
+            pairs.append(a)
+        new_root = pairs.pop() if pairs else None
+        while pairs:
+            new_root = _meld(pairs.pop(), new_root)
+        self._root = new_root
+        return root.key, root.item
+
+
+class BucketQueue:
+    def __init__(self, max_weight: int) -> None:
+        self._size = int(max_weight) + 1
+        self._buckets: List[set] = [set() for _ in range(self._size)]
+        self._key: Dict[Any, float] = {}
+        # Ключ останнього вийнятого елемента: усі ключі в черзі лежать у [_cur, _cur + C]
+        self._cur = 0
+
+    def __len__(self) -> int:
+        return len(self._key)
+
+    def push(self, item: Any, key: float) -> None:
+        old = self._key.get(item)
+        if old is not None:
+            if key >= old:
+                return
+            self._buckets[int(old) % self._size].discard(item)
+        self._key[item] = key
+        self._buckets[int(key) % self._size].add(item)
+
+    def pop(self) -> Tuple[float, Any]:
+        if not self._key:
+            raise IndexError("pop from empty BucketQueue")
+        buckets, size = self._buckets, self._size
+        while not buckets[self._cur % size]:
+            self._cur += 1
+        item = buckets[self._cur % size].pop()
+        return self._key.pop(item), item
+
+
+class RadixHeap:
+    def __init__(self) -> None:
+        self._buckets: List[set] = [set() for _ in range(65)]
+        self._key: Dict[Any, float] = {}
+        self._last = 0
+
+    def __len__(self) -> int:
+        return len(self._key)
+
+    def _bucket(self, key: float) -> int:
+        return (int(key) ^ self._last).bit_length()
+
+    def push(self, item: Any, key: float) -> None:
+        old = self._key.get(item)
+        if old is not None:
+            if key >= old:
+                return
+            self._buckets[self._bucket(old)].discard(item)
+        self._key[item] = key
+        self._buckets[self._bucket(key)].add(item)
+
+    def pop(self) -> Tuple[float, Any]:
+        if not self._key:
+            raise IndexError("pop from empty RadixHeap")
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            # Новий last — мінімум непорожнього кошика; його елементи
+            # перерозподіляються у кошики з меншими номерами
+            moved, buckets[i] = buckets[i], set()
+            self._last = int(min(self._key[item] for item in moved))
+            for item in moved:
+                buckets[self._bucket(self._key[item])].add(item)
+        item = buckets[0].pop()
+        return self._key.pop(item), item
+
+
+QUEUES = ("heapq", "binary", "pairing", "dial", "radix", "auto")
+
+
+def make_queue(kind: str, weights: Iterable[float] = ()):
+    """
+    Створює чергу за назвою. Для "dial", "radix" і "auto" потрібні ваги ребер
+    ("dial" і "radix" відмовляються від дробових з ValueError):
+    "auto" обирає чергу Діала для цілих ваг до DIAL_MAX_WEIGHT, radix-купу
+    для більших цілих ваг і LazyHeap для дробових (у CPython heapq на C
+    швидший за чисто пітонівські купи з decrease-key).
+    """
+    if kind == "heapq":
+        return LazyHeap()
+    if kind == "binary":
+        return IndexedBinaryHeap()
+    if kind == "pairing":
+        return PairingHeap()
+    if kind in ("dial", "radix", "auto"):
+        max_w, integral = 0, True
+        for w in weights:
+            if w != int(w):
+                integral = False
+                break
+            if w > max_w:
+                max_w = w
+        if kind == "dial":
+            if not integral:
+                raise ValueError("Черга Діала потребує цілих ваг ребер.")
+            return BucketQueue(int(max_w))
+        if kind == "radix":
+            # int(key) у RadixHeap._bucket зливав би 1.1 і 1.9 в один кошик
+            if not integral:
+                raise ValueError("Radix-купа потребує цілих ваг ребер.")
+            return RadixHeap()
+        if not integral:
+            return LazyHeap()
+        return BucketQueue(int(max_w)) if max_w <= DIAL_MAX_WEIGHT else RadixHeap()
+    raise ValueError(f"Невідомий тип черги {kind!r}; доступні: {', '.join(QUEUES)}.")
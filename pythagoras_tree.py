@@ -3,11 +3,18 @@
 Завдання 2. Рекурсія. Фрактал "дерево Піфагора".
 Використано matplotlib для візуалізації (без seaborn).
 Користувач задає рівень рекурсії (depth).
+
+Для великих глибин є пакетний варіант: tree_segments ітеративно, рівень за
+рівнем, обчислює в NumPy кінці всіх гілок і їхні товщини, а draw_tree_batched
+малює їх однією LineCollection (замість ~2^depth окремих ax.plot) і
+відкидає гілки, коротші за частку пікселя. matplotlib імпортується лише
+під час малювання, тож tree_segments працює без нього.
 """
 
 import math
 import argparse
-import matplotlib.pyplot as plt
+
+from lazy_numpy import HAS_NUMPY, import_numpy
 
 def draw_tree(ax, x, y, length, angle_deg, depth):
     """
@@ -31,20 +38,88 @@ def draw_tree(ax, x, y, length, angle_deg, depth):
     draw_tree(ax, x2, y2, new_len, angle_deg + 45.0, depth - 1)
     draw_tree(ax, x2, y2, new_len, angle_deg - 45.0, depth - 1)
 
-def main():
-    parser = argparse.ArgumentParser(description="Піфагорове дерево (рекурсія)")
-    parser.add_argument("-d", "--depth", type=int, default=10, help="Рівень рекурсії (наприклад, 10)")
-    parser.add_argument("-l", "--length", type=float, default=200.0, help="Початкова довжина стовбура")
-    args = parser.parse_args()
+def tree_segments(depth, length, x=0.0, y=0.0, angle_deg=90.0, min_length=1e-3):
+    """
+    Геометрія того самого дерева, що й draw_tree, без рекурсії: на кожному
+    рівні всі гілки обробляються одним векторним кроком.
+    Повертає (segments формою (M, 2, 2), widths формою (M,), levels формою (M,)).
+    Гілки коротші за min_length (і всі їхні нащадки) відкидаються.
+    """
+    np = import_numpy()
+    if np is None:
+        raise ImportError("tree_segments потребує NumPy: pip install numpy")
+    xs, ys = np.array([x], dtype=float), np.array([y], dtype=float)
+    angles = np.array([math.radians(angle_deg)])
+    segments, widths, levels = [], [], []
+    for level in range(depth):
+        if length < min_length or xs.size == 0:
+            break
+        x2 = xs + length * np.cos(angles)
+        y2 = ys + length * np.sin(angles)
+        segments.append(np.stack([np.column_stack([xs, ys]), np.column_stack([x2, y2])], axis=1))
+        widths.append(np.full(xs.size, max(1.0, (depth - level) * 0.7)))
+        levels.append(np.full(xs.size, level))
+        # Кожна гілка дає дві дочірні під кутом ±45°
+        xs, ys = np.repeat(x2, 2), np.repeat(y2, 2)
+        angles = np.repeat(angles, 2) + np.tile([math.pi / 4, -math.pi / 4], angles.size)
+        length /= math.sqrt(2.0)
+    if not segments:
+        return np.empty((0, 2, 2)), np.empty(0), np.empty(0, dtype=int)
+    return np.concatenate(segments), np.concatenate(widths), np.concatenate(levels)
+
+def draw_tree_batched(ax, length, depth, lod_px=1.0):
+    """
+    Малює дерево однією LineCollection. lod_px — мінімальна довжина гілки
+    в пікселях: дрібніші гілки все одно зливаються в точку й не малюються.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba_array
+    fig = ax.figure
+    px_per_unit = fig.get_figwidth() * fig.dpi * ax.get_position().width / (2 * length)
+    segments, widths, levels = tree_segments(depth, length, min_length=lod_px / px_per_unit)
+    # Колір за рівнем з циклу кольорів matplotlib; RGBA-масив, а не рядки на кожну гілку
+    palette = to_rgba_array(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+    lines = LineCollection(segments, linewidths=widths, colors=palette[levels % len(palette)])
+    ax.add_collection(lines)
+    return lines
 
+def render(depth, length=200.0, engine="auto", lod=1.0, save=None):
+    """
+    Малює дерево глибини depth і показує вікно (або зберігає в файл save).
+    engine: "recursive" — draw_tree, "batched" — draw_tree_batched,
+    "auto" — batched з глибини 13, якщо є NumPy.
+    """
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots(figsize=(8, 8))
-    draw_tree(ax, x=0.0, y=0.0, length=args.length, angle_deg=90.0, depth=args.depth)
+    if engine == "auto":
+        engine = "batched" if depth > 12 and HAS_NUMPY else "recursive"
+    if engine == "batched":
+        # Межі осей задаємо до побудови: від них залежить масштаб пікселя для LOD
+        ax.set_xlim(-length, length)
+        draw_tree_batched(ax, length, depth, lod_px=lod)
+    else:
+        draw_tree(ax, x=0.0, y=0.0, length=length, angle_deg=90.0, depth=depth)
     ax.set_aspect("equal")
     ax.axis("off")
-    ax.set_xlim(-args.length, args.length)
-    ax.set_ylim(0, args.length * 2)
+    ax.set_xlim(-length, length)
+    ax.set_ylim(0, length * 2)
     plt.tight_layout()
-    plt.show()
+    if save:
+        fig.savefig(save)
+        plt.close(fig)
+    else:
+        plt.show()
+
+def main():
+    parser = argparse.ArgumentParser(description="Піфагорове дерево (рекурсія)")
+    parser.add_argument("-d", "--depth", type=int, default=10, help="Рівень рекурсії (наприклад, 10)")
+    parser.add_argument("-l", "--length", type=float, default=200.0, help="Початкова довжина стовбура")
+    parser.add_argument("--engine", choices=["auto", "recursive", "batched"], default="auto",
+                        help="recursive — draw_tree, batched — одна LineCollection (auto: batched з глибини 13)")
+    parser.add_argument("--lod", type=float, default=1.0, help="Мінімальна довжина гілки в пікселях (batched)")
+    args = parser.parse_args()
+    render(args.depth, args.length, args.engine, args.lod)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,128 @@
+"""
+Обходи бінарного дерева без рекурсії й без matplotlib.
+
+Вузол — будь-який об'єкт з атрибутами left і right (None — немає дитини).
+Усі обходи — генератори: вузли видаються ліниво, без попереднього списку
+всіх вузлів і без множини visited (у дереві кожен вузол досяжний один раз).
+
+Додаткова пам'ять: preorder / inorder / postorder — O(висота) (стек),
+bfs / level_order — O(ширина найширшого рівня) (черга).
+"""
+
+from collections import deque
+
+
+def bfs(root):
+    """Обхід у ширину (черга)."""
+    if root is None:
+        return
+    q = deque([root])
+    while q:
+        cur = q.popleft()
+        yield cur
+        if cur.left is not None: q.append(cur.left)
+        if cur.right is not None: q.append(cur.right)
+
+
+def level_order(root):
+    """Обхід у ширину з глибиною: пари (depth, node), корінь має depth 0."""
+    if root is None:
+        return
+    q = deque([(root, 0)])
+    while q:
+        cur, depth = q.popleft()
+        yield depth, cur
+        if cur.left is not None: q.append((cur.left, depth + 1))
+        if cur.right is not None: q.append((cur.right, depth + 1))
+
+
+def preorder(root):
+    """DFS: вузол, лівий, правий (стек)."""
+    stack = [root] if root is not None else []
+    while stack:
+        cur = stack.pop()
+        yield cur
+        # Спочатку правий, потім лівий — щоб лівий обробився першим
+        if cur.right is not None: stack.append(cur.right)
+        if cur.left is not None: stack.append(cur.left)
+
+
+def inorder(root):
+    """DFS: лівий, вузол, правий."""
+    stack = []
+    cur = root
+    while stack or cur is not None:
+        while cur is not None:
+            stack.append(cur)
+            cur = cur.left
+        cur = stack.pop()
+        yield cur
+        cur = cur.right
+
+
+def postorder(root):
+    """DFS: лівий, правий, вузол. Один стек і вказівник на останній виданий вузол."""
+    stack = []
+    cur, last = root, None
+    while stack or cur is not None:
+        while cur is not None:
+            stack.append(cur)
+            cur = cur.left
+        top = stack[-1]
+        if top.right is not None and top.right is not last:
+            cur = top.right
+        else:
+            stack.pop()
+            yield top
+            last = top
+
+
+TRAVERSALS = {
+    "bfs": bfs,
+    "dfs": preorder,
+    "preorder": preorder,
+    "inorder": inorder,
+    "postorder": postorder,
+}
+
+
+def gradient_color(t, start="#12304A", end="#C6E3FF"):
+    """HEX-колір у точці t з [0, 1] градієнта від start до end."""
+    s = [int(start.lstrip("#")[i:i+2], 16) for i in (0, 2, 4)]
+    e = [int(end.lstrip("#")[i:i+2], 16) for i in (0, 2, 4)]
+    return "#" + "".join(f"{round(a + (b - a) * t):02X}" for a, b in zip(s, e))
+
+
+def index_colors(n, start="#12304A", end="#C6E3FF"):
+    """Генератор n кольорів градієнта (i-й колір обчислюється на льоту)."""
+    for i in range(n):
+        yield gradient_color(i / (n - 1) if n > 1 else 0.0, start, end)
+
+
+def depth_color(depth, height, start="#12304A", end="#C6E3FF"):
+    """Колір за глибиною вузла: корінь — start, найглибший рівень — end."""
+    return gradient_color(depth / height if height else 0.0, start, end)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    class Node:
+        __slots__ = ("val", "left", "right")
+
+        def __init__(self, val):
+            self.val, self.left, self.right = val, None, None
+
+    # Повне дерево з ~1 млн вузлів будується рівнями, без рекурсії
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    nodes = [Node(i) for i in range(n)]
+    for i in range(n):
+        if 2*i + 1 < n: nodes[i].left = nodes[2*i + 1]
+        if 2*i + 2 < n: nodes[i].right = nodes[2*i + 2]
+    root = nodes[0]
+    del nodes
+    for name, walk in TRAVERSALS.items():
+        start = time.perf_counter()
+        count = sum(1 for _ in walk(root))
+        print(f"{name:>9}: {count} вузлів за {time.perf_counter() - start:.2f} с")
@@ -1,9 +1,16 @@
 
+"""
+Крокова візуалізація обходів бінарного дерева (matplotlib; networkx — лише draw_tree).
+Самі обходи — у tree_traversal; networkx і matplotlib імпортуються лише
+всередині функцій малювання, тож побудова дерев і обходи їх не потребують.
+"""
+
+import math
 import uuid
 import time
 from collections import deque
-import networkx as nx
-import matplotlib.pyplot as plt
+
+from tree_traversal import TRAVERSALS, bfs, preorder, index_colors
 
 class Node:
     def __init__(self, key, color="#6CA6CD"):
@@ -14,41 +21,51 @@ class Node:
         self.id = str(uuid.uuid4())
 
 def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    if node is not None:
+    # Явний стек замість рекурсії: глибокі (вироджені) дерева не впираються в
+    # ліміт рекурсії. Завдання виконуються в тому ж порядку, що й у рекурсивній
+    # версії: ребро до лівої дитини, її піддерево, ребро до правої, її піддерево
+    stack = [(None, node, x, y, layer)] if node is not None else []
+    while stack:
+        parent, node, x, y, layer = stack.pop()
+        if parent is not None:
+            graph.add_edge(parent.id, node.id)
+            continue
         graph.add_node(node.id, color=node.color, label=node.val, node_ref=node)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+        step = math.ldexp(1.0, -layer)
+        for child, cx in ((node.right, x + step), (node.left, x - step)):
+            if child:
+                pos[child.id] = (cx, y - 1)
+                stack.append((None, child, cx, y - 1, layer + 1))
+                stack.append((node, child, None, None, None))
     return graph
 
+def tree_layout(root):
+    """
+    Розкладка без networkx і без рекурсії: вузли в порядку BFS, їхні
+    координати (як у add_edges: дитина зміщена на 1/2^layer) і пари
+    (індекс батька, індекс дитини) для ребер.
+    """
+    nodes, xy, edges = [], [], []
+    q = deque([(root, 0.0, 0, -1)]) if root is not None else deque()
+    while q:
+        node, x, depth, parent = q.popleft()
+        i = len(nodes)
+        nodes.append(node)
+        xy.append((x, -depth))
+        if parent >= 0:
+            edges.append((parent, i))
+        step = math.ldexp(1.0, -(depth + 1))
+        if node.left: q.append((node.left, x - step, depth + 1, i))
+        if node.right: q.append((node.right, x + step, depth + 1, i))
+    return nodes, xy, edges
+
 def hex_gradient(n, start="#12304A", end="#C6E3FF"):
     """
     Генерує n кольорів у 16-ковому форматі від темного до світлого.
     """
-    def h2rgb(h):
-        h = h.lstrip("#")
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-    def rgb2h(r,g,b):
-        return f"#{r:02X}{g:02X}{b:02X}"
-    rs, gs, bs = h2rgb(start)
-    re, ge, be = h2rgb(end)
     if n <= 1:
         return [start]
-    out = []
-    for i in range(n):
-        t = i / (n - 1)
-        r = round(rs + (re - rs) * t)
-        g = round(gs + (ge - gs) * t)
-        b = round(bs + (be - bs) * t)
-        out.append(rgb2h(r,g,b))
-    return out
+    return list(index_colors(n, start, end))
 
 def collect_nodes(root):
     """Повертає список вузлів у довільному порядку для підрахунку N."""
@@ -64,6 +81,8 @@ def collect_nodes(root):
     return [n for n in order if n is not None]
 
 def draw_tree(tree_root, node_colors=None, pause=None, title=None):
+    import networkx as nx
+    import matplotlib.pyplot as plt
     tree = nx.DiGraph()
     pos = {tree_root.id: (0, 0)}
     add_edges(tree, tree_root, pos)
@@ -78,48 +97,119 @@ def draw_tree(tree_root, node_colors=None, pause=None, title=None):
     plt.axis('off')
     plt.pause(pause if pause is not None else 0.5)
 
-def bfs_iterative(root, pause=0.6):
+class TraversalAnimator:
+    """
+    Покадрова анімація обходу без перебудови графа: розкладка (tree_layout),
+    ребра (одна LineCollection), вузли (один scatter) і підписи малюються
+    один раз, а кожен кадр лише змінює колір одного вузла. Підходить для
+    дерев з тисячами вузлів, у т.ч. вироджених.
+    """
+    def __init__(self, root, title="", figsize=(8,5), base_color="#6CA6CD"):
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba_array
+        nodes, self.xy, edges = tree_layout(root)
+        self.node_ids = [node.id for node in nodes]
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        n = len(self.node_ids)
+        node_size = 2500 if n <= 31 else max(10, 80000 // n)
+        self.fig = plt.figure(figsize=figsize)
+        self.ax = self.fig.gca()
+        self.ax.set_title(title)
+        self.ax.axis('off')
+        self.ax.add_collection(LineCollection([(self.xy[p], self.xy[c]) for p, c in edges],
+                                              colors="black", linewidths=1.0, zorder=1))
+        self.colors = to_rgba_array([base_color] * n)
+        self.nodes = self.ax.scatter([p[0] for p in self.xy], [p[1] for p in self.xy],
+                                     s=node_size, c=self.colors, zorder=2, clip_on=False)
+        self.labels = []
+        if n <= 200:
+            self.labels = [self.ax.annotate(str(node.val), p, ha="center", va="center", zorder=3)
+                           for node, p in zip(nodes, self.xy)]
+        # Один вузол, що домальовується поверх кадру в play(); обвідка на 1 pt
+        # ширша, щоб перекрити згладжений край старого кольору під ним
+        self._spot = self.ax.scatter([0.0], [0.0], s=node_size, edgecolors="face",
+                                     linewidths=self.nodes.get_linewidths()[0] + 1.0,
+                                     zorder=2, clip_on=False, animated=True)
+        self.ax.autoscale_view()
+        self.ax.margins(0.05)
+
+    def paint(self, node_id, color):
+        from matplotlib.colors import to_rgba
+        self.colors[self.index[node_id]] = to_rgba(color)
+        self.nodes.set_facecolor(self.colors)
+        return (self.nodes,)
+
+    def _on_draw(self, event):
+        # Повне перемальовування (перший показ, зміна розміру вікна) пропускає
+        # animated-артисти — домальовуємо вузли з поточними кольорами й підписи
+        self.ax.draw_artist(self.nodes)
+        for label in self.labels:
+            self.ax.draw_artist(label)
+
+    def play(self, order, palette, pause=0.6):
+        """
+        Показує обхід наживо. Вузли й підписи — animated-артисти, тож кадр не
+        перемальовує фігуру: поверх уже показаного зображення малюється лише
+        перефарбований вузол (і його підпис), після чого робиться blit.
+        """
+        import matplotlib.pyplot as plt
+        canvas = self.fig.canvas
+        for artist in [self.nodes, *self.labels]:
+            artist.set_animated(True)
+        cid = canvas.mpl_connect("draw_event", self._on_draw)
+        plt.show(block=False)
+        canvas.draw()
+        for node, color in zip(order, palette):
+            i = self.index[node.id]
+            self.paint(node.id, color)
+            self._spot.set_offsets([self.xy[i]])
+            self._spot.set_facecolor(color)
+            self.ax.draw_artist(self._spot)
+            if self.labels:
+                self.ax.draw_artist(self.labels[i])
+            canvas.blit(self.fig.bbox)
+            canvas.flush_events()
+            # start_event_loop, а не plt.pause: pause перемальовує всю фігуру;
+            # timeout <= 0 означав би "без обмеження", тому нульову паузу пропускаємо
+            if pause > 0:
+                canvas.start_event_loop(pause)
+        canvas.mpl_disconnect(cid)
+        for artist in [self.nodes, *self.labels]:
+            artist.set_animated(False)
+        plt.show()
+
+    def save(self, order, palette, path, fps=2):
+        """Експортує обхід у GIF (Pillow) або відео (ffmpeg) з blit-оновленням вузлів."""
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation, PillowWriter, FFMpegWriter
+        frames = list(zip(order, palette))
+        anim = FuncAnimation(self.fig, lambda k: self.paint(frames[k][0].id, frames[k][1]),
+                             frames=len(frames), blit=True, repeat=False)
+        writer = PillowWriter(fps=fps) if path.lower().endswith(".gif") else FFMpegWriter(fps=fps)
+        anim.save(path, writer=writer)
+        plt.close(self.fig)
+
+def animate_traversal(root, walk, title, pause=0.6, save=None, fps=2):
+    """
+    Анімує обхід walk (генератор з tree_traversal). Кількість вузлів береться
+    з уже побудованої розкладки, тож окремого проходу collect_nodes немає,
+    а кольори палітри обчислюються на льоту.
+    """
+    animator = TraversalAnimator(root, title=title)
+    palette = index_colors(len(animator.node_ids))
+    if save:
+        animator.save(walk(root), palette, save, fps=fps)
+    else:
+        animator.play(walk(root), palette, pause=pause)
+
+def bfs_iterative(root, pause=0.6, save=None, fps=2):
     """Обхід у ширину з чергою. Без рекурсії. Поступова зміна кольорів."""
-    nodes = collect_nodes(root)
-    palette = hex_gradient(len(nodes))
-    idx = 0
-    node_color = {}
-    q = deque([root])
-    visited = set()
-    plt.figure(figsize=(8,5))
-    while q:
-        cur = q.popleft()
-        if cur is None or cur.id in visited:
-            continue
-        visited.add(cur.id)
-        node_color[cur.id] = palette[idx]
-        idx += 1
-        draw_tree(root, node_colors=node_color, pause=pause, title="BFS (черга)")
-        if cur.left: q.append(cur.left)
-        if cur.right: q.append(cur.right)
-    plt.show()
-
-def dfs_iterative(root, pause=0.6):
+    animate_traversal(root, bfs, "BFS (черга)", pause=pause, save=save, fps=fps)
+
+def dfs_iterative(root, pause=0.6, save=None, fps=2):
     """Обхід у глибину зі стеком (preorder: node, left, right). Без рекурсії."""
-    nodes = collect_nodes(root)
-    palette = hex_gradient(len(nodes))
-    idx = 0
-    node_color = {}
-    stack = [root]
-    visited = set()
-    plt.figure(figsize=(8,5))
-    while stack:
-        cur = stack.pop()
-        if cur is None or cur.id in visited:
-            continue
-        visited.add(cur.id)
-        node_color[cur.id] = palette[idx]
-        idx += 1
-        draw_tree(root, node_colors=node_color, pause=pause, title="DFS (стек)")
-        # Важливо: спочатку правий, потім лівий — щоб лівий обробився першим
-        if cur.right: stack.append(cur.right)
-        if cur.left: stack.append(cur.left)
-    plt.show()
+    animate_traversal(root, preorder, "DFS (стек)", pause=pause, save=save, fps=fps)
 
 def build_sample_tree():
     root = Node(0)
@@ -130,15 +220,31 @@ def build_sample_tree():
     root.right.left = Node(3)
     return root
 
+def build_complete_tree(n):
+    """Повне бінарне дерево з n вузлів (значення — індекси), без рекурсії."""
+    if n <= 0:
+        return None
+    nodes = [Node(i) for i in range(n)]
+    for i in range(n):
+        if 2*i + 1 < n: nodes[i].left = nodes[2*i + 1]
+        if 2*i + 2 < n: nodes[i].right = nodes[2*i + 2]
+    return nodes[0]
+
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Візуалізація обходів бінарного дерева (BFS/DFS)")
-    parser.add_argument("--mode", choices=["bfs","dfs"], default="bfs", help="Тип обходу")
+    parser.add_argument("--mode", choices=list(TRAVERSALS), default="bfs", help="Тип обходу")
     parser.add_argument("--pause", type=float, default=0.6, help="Пауза між кроками (сек)")
+    parser.add_argument("--nodes", type=int, default=None, help="Повне дерево з N вузлів замість прикладу")
+    parser.add_argument("--save", default=None, help="Зберегти анімацію у файл (.gif або відео через ffmpeg)")
+    parser.add_argument("--fps", type=int, default=2, help="Кадрів на секунду для --save")
     args = parser.parse_args()
 
-    root = build_sample_tree()
+    root = build_complete_tree(args.nodes) if args.nodes else build_sample_tree()
     if args.mode == "bfs":
-        bfs_iterative(root, pause=args.pause)
+        bfs_iterative(root, pause=args.pause, save=args.save, fps=args.fps)
+    elif args.mode == "dfs":
+        dfs_iterative(root, pause=args.pause, save=args.save, fps=args.fps)
     else:
-        dfs_iterative(root, pause=args.pause)
+        animate_traversal(root, TRAVERSALS[args.mode], args.mode, pause=args.pause,
+                          save=args.save, fps=args.fps)
@@ -0,0 +1,36 @@
+"""
+Детерміновані генератори навантаження з фіксованим зерном: випадкові
+розріджені графи, списки чисел і меню страв. Використовуються в
+benchmarks.py і в cli.py (--random), тож CLI не імпортує бенчмарки.
+"""
+
+from typing import Dict, List
+import random
+
+from dijkstra_heap import Graph
+
+SEED = 12345
+
+
+def random_sparse_graph(n: int, avg_degree: int = 4, seed: int = SEED,
+                        max_weight: int = 100) -> Graph:
+    """Зв'язний орієнтований граф: гамільтонів цикл плюс випадкові ребра."""
+    rng = random.Random(seed)
+    g = Graph(directed=True)
+    for v in range(n):
+        g.add_edge(v, (v + 1) % n, rng.randint(1, max_weight))
+    for _ in range(n * (avg_degree - 1)):
+        g.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(1, max_weight))
+    return g
+
+
+def random_values(n: int, seed: int = SEED) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(n * 10) for _ in range(n)]
+
+
+def random_menu(n_items: int, seed: int = SEED) -> Dict[str, Dict[str, int]]:
+    """Меню у форматі meal_selection: {назва: {"cost": ..., "calories": ...}}."""
+    rng = random.Random(seed)
+    return {f"item{i}": {"cost": rng.randint(5, 60), "calories": rng.randint(50, 500)}
+            for i in range(n_items)}